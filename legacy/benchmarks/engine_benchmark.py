@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+"""
+Benchmark suite for the lottery engines.
+
+Measures Simulator construction time, draws per second of every engine (the
+scalar play_lottery path and the batch path), peak traced memory and time to
+converge for the streaming and variance-reduced runners, over a grid of league
+sizes, ball counts and iteration counts. Results are written as JSON; the
+compare command flags metrics that regressed against a stored baseline.
+
+Usage:
+    python benchmarks/engine_benchmark.py run --output results.json
+    python benchmarks/engine_benchmark.py run --teams 12 --balls 4 --iters 1000 100000
+    python benchmarks/engine_benchmark.py compare baseline.json results.json --threshold 0.1
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from lottery.convergence import run_until_converged  # noqa: E402
+from lottery.lottery import ENGINES, build_sampler, default_chances  # noqa: E402
+from lottery.lottery_simulator import Simulator  # noqa: E402
+from lottery.parallel import simulate_counts  # noqa: E402
+from lottery.variance import ClockEstimator, run_variance_reduced  # noqa: E402
+
+DEFAULT_TEAMS = [8, 12, 16, 24, 32]
+DEFAULT_BALLS = [3, 4, 5, 6]
+DEFAULT_ITERS = [100, 10000, 1000000, 10000000]
+SCALAR_ITERS = 1000
+# Lotteries timed first to project the scalar run time
+SCALAR_PROBE = 5
+# Batch probes double in size until one takes this long, to measure a rate
+BATCH_PROBE_SECONDS = 0.05
+# Convergence chunks are sized to this share of the time budget
+CONVERGENCE_CHUNKS = 10
+
+# Whether a larger value of each metric is better; others are lower-is-better
+HIGHER_IS_BETTER = {"draws_per_sec": True}
+
+
+def _timed(function):
+    start = time.perf_counter()
+    value = function()
+    return value, time.perf_counter() - start
+
+
+def _peak_memory(function):
+    tracemalloc.start()
+    try:
+        value = function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return value, peak
+
+
+def bench_construction(n_teams, n_balls, repeats=3):
+    """Best-of-N Simulator construction time and its peak memory."""
+    chances = default_chances(n_teams)
+    seconds = min(_timed(lambda: Simulator(n_teams, n_balls, chances))[1] for _ in range(repeats))
+    _, peak = _peak_memory(lambda: Simulator(n_teams, n_balls, chances))
+    return {"seconds": seconds, "peak_bytes": peak}
+
+
+def bench_scalar(sim, max_seconds, n_iters=SCALAR_ITERS, probe=SCALAR_PROBE):
+    """
+    Draws per second of the one-lottery-at-a-time play_lottery path.
+
+    Up to probe lotteries project the run time first, stopping as soon as
+    the run is projected to take longer than max_seconds, which is then
+    recorded as skipped.
+    """
+    start = time.perf_counter()
+    for played in range(1, probe + 1):
+        sim.play_lottery()
+        projected = (time.perf_counter() - start) * n_iters / played
+        if projected > max_seconds:
+            return {"skipped": True, "projected_seconds": projected}
+    _, seconds = _timed(lambda: [sim.play_lottery() for _ in range(n_iters)])
+    return {"seconds": seconds, "draws_per_sec": n_iters / seconds}
+
+
+def probe_rate(sampler, max_seconds, min_seconds=BATCH_PROBE_SECONDS):
+    """
+    Lotteries per second of a batch sampler, from a few small batches.
+
+    Batches start at one lottery and double until one takes min_seconds, so
+    the probe costs about twice that (or one lottery when a single one is
+    slower), and stops early once max_seconds has been spent.
+    """
+    rng = np.random.default_rng(0)
+    size, spent = 1, 0.0
+    while True:
+        _, seconds = _timed(lambda: sampler(size, rng))
+        spent += seconds
+        if seconds >= min_seconds or spent >= max_seconds:
+            return size / max(seconds, 1e-9)
+        size *= 2
+
+
+def bench_batch(sampler, n_teams, n_iters):
+    """Draws per second and peak memory of the chunked batch path."""
+    def run():
+        return simulate_counts(sampler.play_lottery_batch, n_teams, n_iters, seed=0, workers=1)
+
+    _, seconds = _timed(run)
+    _, peak = _peak_memory(run)
+    return {"seconds": seconds, "draws_per_sec": n_iters / seconds, "peak_bytes": peak}
+
+
+def _budgeted_chunks(rate, time_budget):
+    """
+    Chunk size and iteration cap that keep a convergence run within its budget.
+
+    The runners only check their time budget between chunks, so chunks are
+    sized from the probed rate to a fraction of the budget and the total is
+    capped at what the budget allows. Returns None when even one iteration
+    would not fit.
+    """
+    max_iters = int(rate * time_budget)
+    if max_iters < 1:
+        return None
+    return {"chunk_size": min(10000, max(1, max_iters // CONVERGENCE_CHUNKS)), "max_iters": max_iters}
+
+
+def bench_convergence(sampler, n_teams, tol, time_budget, rate):
+    """Time for the streaming runner to bring every CI below tol."""
+    chunks = _budgeted_chunks(rate, time_budget)
+    if chunks is None:
+        return {"skipped": True, "projected_seconds": 1 / rate}
+    result = run_until_converged(sampler.play_lottery_batch, n_teams, tol=tol, time_budget=time_budget,
+                                 rng=0, **chunks)
+    return {"seconds": result.elapsed, "n_iters": result.n_iters, "converged": result.converged}
+
+
+def bench_variance_reduced(sim, tol, time_budget):
+    """Time for the variance-reduced runner to bring every CI below tol."""
+    estimator = ClockEstimator(sim.effective_chances, sim.n_picks)
+    rate = probe_rate(estimator.add_chunk, time_budget)
+    chunks = _budgeted_chunks(rate, time_budget)
+    if chunks is None:
+        return {"skipped": True, "projected_seconds": 1 / rate}
+    result = run_variance_reduced(sim.effective_chances, sim.n_picks, tol=tol, time_budget=time_budget,
+                                  rng=0, **chunks)
+    return {"seconds": result.elapsed, "n_iters": result.n_iters, "converged": result.converged,
+            "speedup": result.speedup}
+
+
+def run_suite(teams, balls, iters, engines, tol, max_seconds):
+    """
+    Run every benchmark over the requested grid.
+
+    Scalar runs and iteration counts whose projected run time (from a short
+    probe, refined by every completed count) exceeds max_seconds are recorded
+    as skipped, and convergence runs are capped at max_seconds worth of
+    lotteries.
+
+    Returns:
+        List of result records
+    """
+    records = []
+
+    def record(benchmark, metrics, **params):
+        entry = {"benchmark": benchmark, **params, **metrics}
+        records.append(entry)
+        print(json.dumps(entry))
+
+    for n_teams in teams:
+        for n_balls in balls:
+            if n_balls > n_teams:
+                continue
+            grid = {"n_teams": n_teams, "n_balls": n_balls}
+            record("construction", bench_construction(n_teams, n_balls), **grid)
+
+            sim = Simulator(n_teams, n_balls, default_chances(n_teams), seed=0)
+            record("scalar", bench_scalar(sim, max_seconds), engine="balls", **grid)
+
+            for engine in engines:
+                sampler = build_sampler(engine, sim, seed=0)
+                rate = probe_rate(sampler.play_lottery_batch, max_seconds)
+                for n_iters in iters:
+                    params = dict(engine=engine, n_iters=n_iters, **grid)
+                    if n_iters / rate > max_seconds:
+                        record("batch", {"skipped": True, "projected_seconds": n_iters / rate}, **params)
+                        continue
+                    metrics = bench_batch(sampler, n_teams, n_iters)
+                    rate = metrics["draws_per_sec"]
+                    record("batch", metrics, **params)
+
+                record("convergence", bench_convergence(sampler, n_teams, tol, max_seconds, rate),
+                       engine=engine, tol=tol, **grid)
+
+            record("convergence", bench_variance_reduced(sim, tol, max_seconds),
+                   engine="variance_reduced", tol=tol, **grid)
+    return records
+
+
+def _record_key(entry):
+    return tuple((name, entry.get(name)) for name in ("benchmark", "engine", "n_teams", "n_balls", "n_iters", "tol"))
+
+
+def compare(baseline, current, threshold):
+    """
+    Find metrics that got worse than the baseline by more than threshold.
+
+    Args:
+        baseline: Results document of the reference run
+        current: Results document of the new run
+        threshold: Allowed relative slowdown (0.1 = 10%)
+
+    Returns:
+        List of human-readable regression descriptions
+    """
+    reference = {_record_key(entry): entry for entry in baseline["results"]}
+    regressions = []
+    for entry in current["results"]:
+        old = reference.get(_record_key(entry))
+        if old is None or old.get("skipped") or entry.get("skipped"):
+            continue
+        for metric in ("seconds", "draws_per_sec", "peak_bytes"):
+            if metric not in entry or not old.get(metric):
+                continue
+            change = (entry[metric] - old[metric]) / old[metric]
+            if HIGHER_IS_BETTER.get(metric, False):
+                change = -change
+            if change > threshold:
+                label = ", ".join(f"{name}={value}" for name, value in _record_key(entry) if value is not None)
+                regressions.append(f"{label}: {metric} {old[metric]:.4g} -> {entry[metric]:.4g} ({change:+.1%} worse)")
+    return regressions
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the lottery engines.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmark suite")
+    run_parser.add_argument("--teams", type=int, nargs="+", default=DEFAULT_TEAMS)
+    run_parser.add_argument("--balls", type=int, nargs="+", default=DEFAULT_BALLS)
+    run_parser.add_argument("--iters", type=int, nargs="+", default=DEFAULT_ITERS)
+    run_parser.add_argument("--engines", nargs="+", choices=ENGINES, default=list(ENGINES))
+    run_parser.add_argument("--tol", type=float, default=0.01, help="CI width for the convergence benchmark")
+    run_parser.add_argument("--max-seconds", type=float, default=30.0,
+                            help="Skip runs projected to take longer than this")
+    run_parser.add_argument("--output", default="benchmark_results.json")
+
+    compare_parser = commands.add_parser("compare", help="Compare results against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="Allowed relative regression before failing")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run_suite(args.teams, args.balls, sorted(args.iters), args.engines, args.tol, args.max_seconds)
+        document = {
+            "meta": {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+            },
+            "results": results,
+        }
+        with open(args.output, 'w') as f:
+            json.dump(document, f, indent=2)
+        print(f"Wrote {len(results)} results to {args.output}")
+        return
+
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+    with open(args.current, 'r') as f:
+        current = json.load(f)
+    regressions = compare(baseline, current, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if regressions:
+        sys.exit(1)
+    print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+Startup-time regression benchmark for the Fantasy Football Lottery GUI.
+
+Launches main.py with --profile-startup --exit-after-paint on Qt's offscreen
+platform several times and fails (exit code 1) if the median time to first
+paint exceeds the budget.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs 5] [--budget-ms 2000]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from startup_profile import EXIT_FLAG, PROFILE_FLAG, REPORT_PREFIX  # noqa: E402
+
+DEFAULT_BUDGET_MS = 2000
+
+
+def measure_startup(timeout=60):
+    """
+    Launch the application once and return its startup profile.
+
+    Args:
+        timeout: Seconds to wait for the application to exit
+
+    Returns:
+        Dictionary parsed from the STARTUP_PROFILE line
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    result = subprocess.run(
+        [sys.executable, "main.py", PROFILE_FLAG, EXIT_FLAG],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith(REPORT_PREFIX):
+            return json.loads(line[len(REPORT_PREFIX):])
+    raise RuntimeError(f"No startup profile in output:\n{result.stdout}\n{result.stderr}")
+
+
+def main():
+    """Run the benchmark and exit non-zero when over budget."""
+    parser = argparse.ArgumentParser(description="Measure GUI time to first paint.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of launches to measure")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="Maximum allowed median time to first paint")
+    args = parser.parse_args()
+
+    profiles = [measure_startup() for _ in range(args.runs)]
+    paints = [profile["marks_ms"]["first_paint"] for profile in profiles]
+    median = statistics.median(paints)
+
+    print("Slowest imports (last run):")
+    slowest = sorted(profiles[-1]["imports_ms"].items(), key=lambda item: item[1], reverse=True)
+    for name, ms in slowest[:10]:
+        print(f"  {ms:8.1f} ms  {name}")
+    print(f"Time to first paint: median {median:.1f} ms over {args.runs} runs "
+          f"(min {min(paints):.1f}, max {max(paints):.1f}), budget {args.budget_ms:.0f} ms")
+
+    if median > args.budget_ms:
+        print("FAIL: startup exceeds budget")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,15 +5,69 @@ Configuration manager for loading and managing application settings from JSON.
 import json
 import os
 import shutil
+import time
 
 from config.paths import get_config_path, get_default_config_path, resolve_resource_path
 
+# Minimum seconds between checks of the config file's modification time
+MTIME_CHECK_INTERVAL = 1.0
+
+
+class ConfigDiff:
+    """Differences between two versions of the configuration."""
+
+    SETTINGS = ("league_name", "number_of_teams", "logo_path", "lottery_rules", "traded_picks",
+                "remaining_schedule")
+
+    def __init__(self, old, new):
+        old = old or {}
+        new = new or {}
+        self.changed_settings = {key for key in self.SETTINGS if old.get(key) != new.get(key)}
+
+        old_owners = {owner["owner"]: owner for owner in old.get("owners", [])}
+        new_owners = {owner["owner"]: owner for owner in new.get("owners", [])}
+        old_names = [owner["owner"] for owner in old.get("owners", [])]
+        new_names = [owner["owner"] for owner in new.get("owners", [])]
+
+        self.added_owners = [name for name in new_names if name not in old_owners]
+        self.removed_owners = [name for name in old_names if name not in new_owners]
+        self.changed_owners = [
+            name for name in new_names if name in old_owners and old_owners[name] != new_owners[name]
+        ]
+        self.order_changed = old_names != new_names
+
+    @property
+    def has_changes(self):
+        """True if anything differs."""
+        return bool(self.changed_settings or self.changed_owners or self.order_changed)
+
+    @property
+    def lottery_changed(self):
+        """True if the lottery parameters (team count, rules, traded picks or seed order) differ."""
+        return bool({"number_of_teams", "lottery_rules", "traded_picks"} & self.changed_settings) or self.order_changed
+
+    def __repr__(self):
+        return (f"ConfigDiff(settings={sorted(self.changed_settings)}, added={self.added_owners}, "
+                f"removed={self.removed_owners}, changed={self.changed_owners}, "
+                f"order_changed={self.order_changed})")
+
 
 class ConfigManager:
     """Manages application configuration from JSON file."""
 
     _instance = None
     _config = None
+    config_path = None
+
+    # Lookup index rebuilt whenever the configuration is (re)loaded
+    _owners_by_name = None
+    _owner_names = None
+    _standings = None
+    _owner_images = None
+    _resolved_paths = None
+    _mtime = None
+    _last_mtime_check = 0.0
+    _listeners = None
 
     def __new__(cls):
         """Ensure singleton pattern."""
@@ -22,11 +76,89 @@ class ConfigManager:
         return cls._instance
 
     def __init__(self):
-        """Initialize the configuration manager."""
-        if self._config is None:
+        """Initialize the configuration manager; the file is read on first access."""
+        if self.config_path is None:
             self.config_path = get_config_path()
+            self._listeners = []
+
+    def add_listener(self, callback):
+        """
+        Register a callback for configuration changes.
+
+        Args:
+            callback: Called with a ConfigDiff whenever a reload changes the
+                configuration. It runs on whichever thread triggered the
+                reload, so GUI code should forward it through a Qt signal.
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Unregister a callback added with add_listener."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def check_for_changes(self):
+        """
+        Reload the configuration now if the file changed on disk.
+
+        Returns:
+            ConfigDiff of the reload, or None if the file was unchanged
+        """
+        if self._config is None or self._file_mtime() == self._mtime:
+            return None
+        return self.reload_config()
+
+    @property
+    def _data(self):
+        """Get the configuration dictionary, loading it on first use."""
+        self._refresh()
+        return self._config
+
+    def _refresh(self):
+        """
+        Load the configuration if needed and reload it if the file changed.
+
+        The file's modification time is checked at most once every
+        MTIME_CHECK_INTERVAL seconds.
+        """
+        if self._config is None:
             self._ensure_writable_config()
             self.load_config()
+        else:
+            now = time.monotonic()
+            if now - self._last_mtime_check >= MTIME_CHECK_INTERVAL:
+                self._last_mtime_check = now
+                if self._file_mtime() != self._mtime:
+                    self.reload_config()
+
+    def _file_mtime(self):
+        """Get the config file's modification time, or None if it is missing."""
+        try:
+            return os.path.getmtime(self.config_path)
+        except OSError:
+            return None
+
+    def _resolve(self, raw_path):
+        """Resolve a resource path, caching the result until the next reload."""
+        resolved = self._resolved_paths.get(raw_path)
+        if resolved is None:
+            resolved = resolve_resource_path(raw_path)
+            self._resolved_paths[raw_path] = resolved
+        return resolved
+
+    def _build_index(self):
+        """Precompute owner lookups for the current configuration."""
+        owners = self._config.get("owners", [])
+        self._mtime = self._file_mtime()
+        self._last_mtime_check = time.monotonic()
+        self._resolved_paths = {}
+
+        self._owners_by_name = {}
+        for owner in owners:
+            self._owners_by_name.setdefault(owner["owner"], owner)
+        self._owner_names = [owner["owner"] for owner in owners]
+        self._standings = [[owner["owner"], owner["team_name"], owner["record"]] for owner in owners]
+        self._owner_images = {owner["owner"]: self._resolve(owner["image_path"]) for owner in owners}
 
     def _ensure_writable_config(self):
         """On first run of a packaged exe, copy bundled default config to writable location."""
@@ -47,6 +179,7 @@ class ConfigManager:
                 self._create_default_config()
         else:
             self._create_default_config()
+        self._build_index()
 
     def _create_default_config(self):
         """Create a default configuration file."""
@@ -139,55 +272,85 @@ class ConfigManager:
                 json.dump(self._config, f, indent=2)
         except Exception as e:
             print(f"Error saving config: {e}")
+        self._build_index()
 
     def reload_config(self):
-        """Reload configuration from file."""
+        """
+        Reload configuration from file and notify listeners of any changes.
+
+        Returns:
+            ConfigDiff between the previous and the reloaded configuration
+        """
+        previous = self._config
         self.load_config()
+        diff = ConfigDiff(previous, self._config)
+        if previous is not None and diff.has_changes:
+            for callback in list(self._listeners):
+                callback(diff)
+        return diff
 
     @property
     def league_name(self):
         """Get league name."""
-        return self._config.get("league_name", "Fantasy Football League")
+        return self._data.get("league_name", "Fantasy Football League")
 
     @property
     def number_of_teams(self):
         """Get number of teams."""
-        return self._config.get("number_of_teams", 12)
+        return self._data.get("number_of_teams", 12)
 
     @property
     def logo_path(self):
         """Get league logo path, resolved to an absolute path."""
-        raw_path = self._config.get("logo_path", "./data/wktownffbllogo.png")
-        return resolve_resource_path(raw_path)
+        raw_path = self._data.get("logo_path", "./data/wktownffbllogo.png")
+        return self._resolve(raw_path)
 
     @property
     def raw_logo_path(self):
         """Get the raw (unresolved) logo path as stored in config."""
-        return self._config.get("logo_path", "./data/wktownffbllogo.png")
+        return self._data.get("logo_path", "./data/wktownffbllogo.png")
+
+    @property
+    def lottery_rules(self):
+        """Get the optional lottery rules section (see lottery.rules), empty for a plain lottery."""
+        return self._data.get("lottery_rules", {})
+
+    @property
+    def traded_picks(self):
+        """Get dictionary mapping owners to whoever now holds their pick."""
+        return self._data.get("traded_picks", {})
+
+    @property
+    def remaining_schedule(self):
+        """Get list of remaining games as dictionaries with 'home' and 'away' owners."""
+        return self._data.get("remaining_schedule", [])
 
     @property
     def owners(self):
         """Get list of owner dictionaries."""
-        return self._config.get("owners", [])
+        return self._data.get("owners", [])
 
     @property
     def owner_images(self):
-        """Get dictionary mapping owner names to resolved image paths."""
-        return {owner["owner"]: resolve_resource_path(owner["image_path"]) for owner in self.owners}
+        """Get dictionary mapping owner names to resolved image paths (shared; do not modify)."""
+        self._refresh()
+        return self._owner_images
 
     @property
     def owner_names(self):
-        """Get list of owner names."""
-        return [owner["owner"] for owner in self.owners]
+        """Get list of owner names (shared; do not modify)."""
+        self._refresh()
+        return self._owner_names
 
     def get_standings_data(self):
         """
         Get standings data in the format expected by the standings widget.
 
         Returns:
-            List of lists containing [owner, team_name, record]
+            List of lists containing [owner, team_name, record] (shared; do not modify)
         """
-        return [[owner["owner"], owner["team_name"], owner["record"]] for owner in self.owners]
+        self._refresh()
+        return self._standings
 
     def get_owner_by_name(self, name):
         """
@@ -199,10 +362,22 @@ class ConfigManager:
         Returns:
             Owner dictionary or None if not found
         """
-        for owner in self.owners:
-            if owner["owner"] == name:
-                return owner
-        return None
+        self._refresh()
+        return self._owners_by_name.get(name)
+
+
+def read_league_config(path):
+    """
+    Read a league configuration file without touching the global config.
+
+    Args:
+        path: Path to a league_config.json-style file
+
+    Returns:
+        Configuration dictionary
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
 
 
 # Global config instance
@@ -49,6 +49,16 @@ def get_config_path():
     return os.path.join(get_app_dir(), "config", "league_config.json")
 
 
+def get_cache_dir():
+    """
+    Get the directory for cached computation results (e.g. odds tables).
+
+    When packaged: <exe_dir>/cache
+    When in dev: <project_root>/cache
+    """
+    return os.path.join(get_app_dir(), "cache")
+
+
 def get_default_config_path():
     """
     Get the path to the bundled default config (read-only in packaged mode).
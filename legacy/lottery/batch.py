@@ -0,0 +1,166 @@
+"""
+Batch planner for computing odds for many leagues at once.
+
+Leagues with the same number of teams, picks, chance schedule and lottery
+rules have the same probability matrix whatever their owners are called. The
+planner groups league configs by these canonical lottery parameters, computes
+each distinct matrix once (groups in parallel) and fans the result out to
+every league in the group, so the work scales with the number of distinct
+structures.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from config.config_manager import read_league_config
+from .lottery import LotterySim, default_chances
+from .rules import LotteryRules
+
+
+class LeagueGroup():
+    """Leagues sharing one set of canonical lottery parameters."""
+
+    def __init__(self, n_teams, n_picks, rules=None):
+        self.n_teams = n_teams
+        self.n_picks = n_picks
+        self.rules = rules
+        self.leagues = []
+
+    @property
+    def chances(self):
+        return default_chances(self.n_teams)
+
+
+def league_owner_names(league):
+    """Owner names of a league config in config order."""
+    return [owner["owner"] for owner in league.get("owners", [])]
+
+
+def league_rules(league, n_teams, n_picks):
+    """
+    Validated lottery rules of a league config, or None for a plain lottery.
+
+    The optional "lottery_rules" section takes the keys of
+    LotteryRules.from_dict; lottery_picks defaults to the league's number of
+    lottery picks.
+    """
+    spec = league.get("lottery_rules")
+    if not spec:
+        return None
+    return LotteryRules.from_dict(n_teams, {'lottery_picks': n_picks, **spec})
+
+
+def canonical_key(league):
+    """
+    Lottery parameters that fully determine a league's probability matrix.
+
+    Args:
+        league: Parsed league_config.json contents
+
+    Returns:
+        Hashable (n_teams, n_picks, rules) key; the chance schedule is derived
+        from n_teams, so two leagues with equal keys share one matrix
+    """
+    n_teams = len(league_owner_names(league))
+    n_picks = league.get("number_of_teams", n_teams)
+    rules = league_rules(league, n_teams, n_picks)
+    if rules is None:
+        return n_teams, n_picks, None
+    return n_teams, rules.lottery_picks, (rules.max_drop, tuple(rules.protected))
+
+
+def plan_batch(paths):
+    """
+    Group league config files by canonical lottery parameters.
+
+    Args:
+        paths: League config file paths
+
+    Returns:
+        List of LeagueGroup, each holding (path, league) pairs
+    """
+    groups = {}
+    for path in paths:
+        league = read_league_config(path)
+        key = canonical_key(league)
+        if key not in groups:
+            groups[key] = LeagueGroup(*key)
+        groups[key].leagues.append((path, league))
+    return list(groups.values())
+
+
+def compute_probabilities(lottery_sim, engine='exact', iters=1000000, workers=None):
+    """Run the requested engine and return the [seed, pick] probability matrix."""
+    if engine == 'exact':
+        return np.asarray(lottery_sim.exactProbabilities())
+    return np.asarray(lottery_sim.parallelProbabilities(iters, workers))
+
+
+def group_rules(n_teams, n_picks, rules):
+    """LotteryRules for a group's (max_drop, protected) key, or None."""
+    if rules is None:
+        return None
+    max_drop, protected = rules
+    return LotteryRules(n_teams, lottery_picks=n_picks, max_drop=max_drop, protected=protected)
+
+
+def compute_group(n_teams, n_picks, engine='exact', iters=1000000, seed=None, workers=1, rules=None):
+    """
+    Compute the probability matrix shared by a group.
+
+    Owner names do not affect the odds, so placeholders are used.
+
+    Returns:
+        (LotterySim, probability matrix) for the group's structure
+    """
+    lottery_sim = LotterySim(
+        seed=seed,
+        engine='balls' if engine == 'exact' else engine,
+        owner_names=[f"team_{i + 1}" for i in range(n_teams)],
+        n_picks=n_picks,
+        rules=group_rules(n_teams, n_picks, rules)
+    )
+    return lottery_sim, compute_probabilities(lottery_sim, engine, iters, workers)
+
+
+def _compute_group_matrix(n_teams, n_picks, engine, iters, seed, rules):
+    return compute_group(n_teams, n_picks, engine, iters, seed, workers=1, rules=rules)[1]
+
+
+def run_batch(groups, engine='exact', iters=1000000, seed=None, workers=None):
+    """
+    Compute every group's matrix once.
+
+    A single group uses all workers for its own simulation; several groups
+    are spread over a process pool with one worker each.
+
+    Args:
+        groups: LeagueGroups from plan_batch
+        engine: 'exact' or one of the Monte Carlo ENGINES
+        iters: Monte Carlo iterations per group
+        seed: Master seed shared by every group
+        workers: Number of processes (defaults to os.cpu_count())
+
+    Returns:
+        List of probability matrices, one per group
+    """
+    if len(groups) == 1:
+        group = groups[0]
+        return [compute_group(group.n_teams, group.n_picks, engine, iters, seed, workers, group.rules)[1]]
+
+    workers = min(workers or os.cpu_count() or 1, len(groups))
+    if workers == 1:
+        return [_compute_group_matrix(g.n_teams, g.n_picks, engine, iters, seed, g.rules) for g in groups]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(
+            _compute_group_matrix,
+            [g.n_teams for g in groups],
+            [g.n_picks for g in groups],
+            [engine] * len(groups),
+            [iters] * len(groups),
+            [seed] * len(groups),
+            [g.rules for g in groups]
+        ))
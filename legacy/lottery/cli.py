@@ -0,0 +1,137 @@
+"""
+Headless command-line entry point for computing lottery odds.
+
+Runs the lottery engines straight from one or more league_config.json files
+(or directories of them) and writes each league's seed-by-pick probability
+matrix, without importing PyQt5.
+
+Usage:
+    python -m lottery.cli config/league_config.json
+    python -m lottery.cli leagues/ --engine gumbel --iters 10000000 --seed 7 --workers 8 --format npy
+"""
+
+import argparse
+import glob
+import multiprocessing
+import os
+import sys
+
+import numpy as np
+
+from .batch import league_owner_names, plan_batch, run_batch
+from .lottery import ENGINES
+
+METHODS = ('exact',) + ENGINES
+FORMATS = ('csv', 'npy', 'parquet')
+
+
+def expand_config_paths(paths):
+    """Expand directories into the .json files they contain."""
+    expanded = []
+    for path in paths:
+        if os.path.isdir(path):
+            expanded.extend(sorted(glob.glob(os.path.join(path, "*.json"))))
+        else:
+            expanded.append(path)
+    return expanded
+
+
+def output_stems(paths, output_dir):
+    """
+    Unique output path stems for the league configs.
+
+    Configs are laid out under output_dir the way they sit below their
+    common directory, so leagues in different folders that share a file name
+    (e.g. many league_config.json files) never overwrite each other.
+
+    Returns:
+        Dict mapping each config path to its output path without extension
+    """
+    absolute = {path: os.path.abspath(path) for path in paths}
+    root = os.path.commonpath([os.path.dirname(a) for a in absolute.values()])
+    return {path: os.path.join(output_dir, os.path.splitext(os.path.relpath(a, root))[0])
+            for path, a in absolute.items()}
+
+
+def write_probabilities(path_stem, places, chances, probabilities, output_format):
+    """
+    Write one league's probability matrix.
+
+    Args:
+        path_stem: Output path without extension
+        places: Owner name of each seed
+        chances: Lottery chances of each seed
+        probabilities: (n_teams, n_teams) [seed, pick] matrix
+        output_format: 'csv', 'npy' or 'parquet'
+
+    Returns:
+        Path of the written file
+    """
+    if output_format == 'npy':
+        path = path_stem + ".npy"
+        np.save(path, probabilities)
+        return path
+
+    n_teams = probabilities.shape[1]
+    if output_format == 'parquet':
+        try:
+            import pandas as pd
+        except ImportError:
+            raise RuntimeError("Parquet output requires pandas (and pyarrow or fastparquet)")
+        path = path_stem + ".parquet"
+        df = pd.DataFrame(probabilities, columns=[f"pick_{i + 1}" for i in range(n_teams)])
+        df.insert(0, "chances", chances)
+        df.insert(0, "owner", places)
+        df.insert(0, "seed", np.arange(1, len(df) + 1))
+        df.to_parquet(path, index=False)
+        return path
+
+    path = path_stem + ".csv"
+    with open(path, 'w') as f:
+        f.write(",".join(["seed", "owner", "chances"] + [f"pick_{i + 1}" for i in range(n_teams)]) + "\n")
+        for seed, row in enumerate(probabilities):
+            cells = [str(seed + 1), places[seed], str(chances[seed])]
+            f.write(",".join(cells + [f"{p:.6f}" for p in row]) + "\n")
+    return path
+
+
+def build_parser():
+    """Create the argument parser for the odds CLI."""
+    parser = argparse.ArgumentParser(description="Compute draft lottery odds without the GUI.")
+    parser.add_argument("configs", nargs="+", help="League config files or directories of them")
+    parser.add_argument("--engine", choices=METHODS, default='exact',
+                        help="Exact solver or Monte Carlo engine (default: exact)")
+    parser.add_argument("--iters", type=int, default=1000000, help="Monte Carlo iterations per league")
+    parser.add_argument("--seed", type=int, default=None, help="Master seed for reproducible results")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--format", choices=FORMATS, default='csv', dest="output_format")
+    parser.add_argument("--output-dir", default="odds_output")
+    return parser
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    args = build_parser().parse_args(argv)
+    paths = expand_config_paths(args.configs)
+    if not paths:
+        print("No league configs found")
+        return 1
+
+    groups = plan_batch(paths)
+    print(f"{len(paths)} leagues, {len(groups)} distinct lottery structures")
+    matrices = run_batch(groups, args.engine, args.iters, args.seed, args.workers)
+
+    stems = output_stems(paths, args.output_dir)
+    for group, probabilities in zip(groups, matrices):
+        for path, league in group.leagues:
+            places = list(reversed(league_owner_names(league)))
+            stem = stems[path]
+            os.makedirs(os.path.dirname(stem), exist_ok=True)
+            written = write_probabilities(stem, places, group.chances, probabilities, args.output_format)
+            print(f"{path} -> {written}")
+    return 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Streaming Monte Carlo runner that stops once the odds table has converged.
+
+Lotteries are played in fixed-size chunks and folded into running per-(seed,
+pick) counts, so memory does not grow with the number of iterations. After
+each chunk the Wilson score interval of every cell is checked against the
+requested tolerance.
+"""
+
+import time
+
+import numpy as np
+
+from .lottery_simulator import order_counts
+
+
+class ConvergenceResult:
+    """Counts and confidence intervals of a streaming simulation run."""
+
+    def __init__(self, counts, n_iters, ci_width, converged, elapsed):
+        self.counts = counts
+        self.n_iters = n_iters
+        self.ci_width = ci_width
+        self.converged = converged
+        self.elapsed = elapsed
+
+    @property
+    def probabilities(self):
+        """Estimated [seed, pick] probabilities."""
+        return self.counts / max(self.n_iters, 1)
+
+
+def wilson_width(counts, n_iters, z=1.96):
+    """
+    Width of the Wilson score interval for each cell of a count matrix.
+
+    Args:
+        counts: Array of success counts
+        n_iters: Number of trials behind every count
+        z: Normal quantile of the confidence level (1.96 for 95%)
+
+    Returns:
+        Array of interval widths with the same shape as counts
+    """
+    if n_iters == 0:
+        return np.ones(np.shape(counts))
+    p = counts / n_iters
+    z2 = z * z
+    spread = np.sqrt(p * (1 - p) / n_iters + z2 / (4 * n_iters * n_iters))
+    return 2 * z * spread / (1 + z2 / n_iters)
+
+
+def run_until_converged(sampler, n_teams, tol=0.01, time_budget=None, chunk_size=10000,
+                        max_iters=None, z=1.96, rng=None):
+    """
+    Play lotteries in chunks until every cell's confidence interval is narrow enough.
+
+    Args:
+        sampler: Callable (n_iters, rng) -> (n_iters, n_teams) array of draw
+            orders, e.g. Simulator.play_lottery_batch
+        n_teams: Number of seeds in each order
+        tol: Largest allowed confidence interval width for any cell
+        time_budget: Seconds after which the run stops even if not converged
+        chunk_size: Lotteries played per chunk
+        max_iters: Optional cap on the total number of lotteries
+        z: Normal quantile of the confidence level (1.96 for 95%)
+        rng: numpy Generator or seed shared by all chunks
+
+    Returns:
+        ConvergenceResult with the counts, iterations used and CI widths
+    """
+    rng = np.random.default_rng(rng)
+    counts = np.zeros((n_teams, n_teams), dtype=np.int64)
+    n_iters = 0
+    start = time.perf_counter()
+
+    while True:
+        size = chunk_size if max_iters is None else min(chunk_size, max_iters - n_iters)
+        counts += order_counts(sampler(size, rng), n_teams)
+        n_iters += size
+
+        ci_width = wilson_width(counts, n_iters, z)
+        converged = bool(ci_width.max() <= tol)
+        elapsed = time.perf_counter() - start
+        if (converged
+                or (max_iters is not None and n_iters >= max_iters)
+                or (time_budget is not None and elapsed >= time_budget)):
+            return ConvergenceResult(counts, n_iters, ci_width, converged, elapsed)
@@ -0,0 +1,197 @@
+"""
+Inverse odds designer: find lottery chances that hit target pick probabilities.
+
+Instead of tuning the chance ramp by hand and re-running simulations, give the
+probabilities you want (e.g. "seed 1 gets pick 1 with 25%") and the designer
+searches integer chances with the exact solver. Chances are kept within the
+C(n_teams, n_balls) ball combinations, so the simulator never has to drop
+surplus balls and the designed odds are exactly the odds of the draw.
+
+Usage:
+    python -m lottery.designer --teams 12 --target 1:1=0.25 --target 2:1=0.2
+    python -m lottery.designer --teams 12 --picks 4 --target 1:1=0.14 --target 12:1=0.005
+"""
+
+import argparse
+import math
+import sys
+import time
+
+import numpy as np
+
+from .exact import pick_probabilities, seed_pick_probabilities
+from .lottery import default_chances
+
+
+class DesignResult:
+    """Chances found by the designer and the odds they produce."""
+
+    def __init__(self, chances, probabilities, targets, evaluations, elapsed):
+        self.chances = chances
+        self.probabilities = probabilities
+        self.targets = targets
+        self.evaluations = evaluations
+        self.elapsed = elapsed
+
+    @property
+    def errors(self):
+        """Achieved minus target probability for each (seed, pick) target."""
+        return {cell: self.probabilities[cell] - target for cell, target in self.targets.items()}
+
+    @property
+    def max_error(self):
+        """Largest absolute deviation from a target."""
+        return max(abs(error) for error in self.errors.values())
+
+
+def combination_budget(n_teams, n_balls):
+    """Number of distinct ball combinations available to hand out as chances."""
+    return math.comb(n_teams, n_balls)
+
+
+def design_chances(targets, n_teams, n_picks=None, n_balls=4, initial=None, min_chance=1,
+                   monotone=True, max_evaluations=20000, time_budget=None):
+    """
+    Search integer chances whose exact odds best match the targets.
+
+    Coordinate search over the chances: every pass tries moving step balls onto
+    or off each seed, and between neighbouring seeds, keeping any move that
+    lowers the squared error. When no move helps the step is halved, down to
+    single balls. Only the rows of the targeted seeds are solved, so an
+    evaluation costs about a millisecond however large the league or late
+    the targeted pick.
+
+    Args:
+        targets: Dict mapping (seed, pick) to the wanted probability (0-based,
+            seed 0 is the worst team)
+        n_teams: Number of teams in the lottery
+        n_picks: Number of picks decided by the lottery (default: all)
+        n_balls: Balls drawn per combination, which sets the chance budget
+        initial: Starting chances (default: the standard ramp scaled to the budget)
+        min_chance: Fewest chances any seed may have
+        monotone: Never give a better team more chances than a worse one
+        max_evaluations: Cap on exact solves
+        time_budget: Optional wall-clock limit in seconds
+
+    Returns:
+        DesignResult with the best chances found
+    """
+    n_picks = n_teams if n_picks is None else n_picks
+    targets = {(int(seed), int(pick)): float(p) for (seed, pick), p in targets.items()}
+    if not targets:
+        raise ValueError("At least one target probability is required")
+    for (seed, pick), p in targets.items():
+        if not (0 <= seed < n_teams and 0 <= pick < n_teams):
+            raise ValueError(f"Target ({seed + 1}, {pick + 1}) is outside a {n_teams}-team league")
+        if not 0 <= p <= 1:
+            raise ValueError(f"Target probability {p} is not between 0 and 1")
+
+    budget = combination_budget(n_teams, n_balls)
+    if n_teams * min_chance > budget:
+        raise ValueError(f"{n_teams} teams need at least {n_teams * min_chance} chances "
+                         f"but only {budget} combinations exist")
+
+    target_seeds = sorted({seed for seed, _ in targets})
+    last_pick = max(pick for _, pick in targets)
+    rows = np.array([target_seeds.index(seed) for seed, _ in targets])
+    picks = np.array([pick for _, pick in targets])
+    wanted = np.array(list(targets.values()))
+
+    evaluated = {}
+
+    def error(chances):
+        key = tuple(chances)
+        if key not in evaluated:
+            probabilities = seed_pick_probabilities(chances, n_picks, target_seeds, last_pick)
+            evaluated[key] = float(((probabilities[rows, picks] - wanted) ** 2).sum())
+        return evaluated[key]
+
+    def feasible(chances):
+        if monotone and any(a < b for a, b in zip(chances, chances[1:])):
+            return False
+        return min(chances) >= min_chance and sum(chances) <= budget
+
+    if initial is None:
+        ramp = np.array(default_chances(n_teams), dtype=np.float64)
+        initial = np.maximum(np.floor(ramp * budget / ramp.sum()), min_chance)
+    chances = [int(c) for c in initial]
+    if len(chances) != n_teams or not feasible(chances):
+        raise ValueError(f"Initial chances must be {n_teams} values of at least {min_chance} "
+                         f"summing to at most {budget}" + (", in non-increasing order" if monotone else ""))
+
+    start = time.perf_counter()
+    best = error(chances)
+    step = max(1, max(chances) // 4)
+    while best > 0 and len(evaluated) < max_evaluations:
+        if time_budget is not None and time.perf_counter() - start >= time_budget:
+            break
+        improved = False
+        for candidate in _moves(chances, step):
+            if feasible(candidate) and error(candidate) < best:
+                chances, best, improved = candidate, error(candidate), True
+        if not improved:
+            if step == 1:
+                break
+            step //= 2
+
+    probabilities = pick_probabilities(chances, n_picks)
+    return DesignResult(chances, probabilities, targets, len(evaluated), time.perf_counter() - start)
+
+
+def _moves(chances, step):
+    """Candidate chances one coordinate move away from the current ones."""
+    for seed in range(len(chances)):
+        for delta in (step, -step):
+            candidate = list(chances)
+            candidate[seed] += delta
+            yield candidate
+    # Transfers keep the total fixed, which matters once the budget is used up
+    for seed in range(len(chances) - 1):
+        for delta in (step, -step):
+            candidate = list(chances)
+            candidate[seed] += delta
+            candidate[seed + 1] -= delta
+            yield candidate
+
+
+def parse_target(text):
+    """Parse a 'SEED:PICK=PROBABILITY' target (1-based seed and pick)."""
+    try:
+        cell, p = text.split("=")
+        seed, pick = cell.split(":")
+        return (int(seed) - 1, int(pick) - 1), float(p)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected SEED:PICK=PROBABILITY, got '{text}'")
+
+
+def build_parser():
+    """Create the argument parser for the designer CLI."""
+    parser = argparse.ArgumentParser(description="Find lottery chances that hit target pick odds.")
+    parser.add_argument("--teams", type=int, required=True, help="Number of teams in the lottery")
+    parser.add_argument("--picks", type=int, default=None, help="Picks decided by the lottery (default: all)")
+    parser.add_argument("--balls", type=int, default=4, help="Balls drawn per combination (default: 4)")
+    parser.add_argument("--target", type=parse_target, action="append", required=True,
+                        help="Target as SEED:PICK=PROBABILITY, seed 1 being the worst team (repeatable)")
+    parser.add_argument("--allow-inversions", action="store_true",
+                        help="Allow a better team to get more chances than a worse one")
+    parser.add_argument("--time-budget", type=float, default=None, help="Stop searching after this many seconds")
+    return parser
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    args = build_parser().parse_args(argv)
+    result = design_chances(dict(args.target), args.teams, n_picks=args.picks, n_balls=args.balls,
+                            monotone=not args.allow_inversions, time_budget=args.time_budget)
+
+    print(f"{result.evaluations} exact solves in {result.elapsed:.2f}s, "
+          f"{sum(result.chances)} of {combination_budget(args.teams, args.balls)} combinations used")
+    print("chances: " + ",".join(str(c) for c in result.chances))
+    for (seed, pick), target in sorted(result.targets.items()):
+        achieved = result.probabilities[seed, pick]
+        print(f"seed {seed + 1} pick {pick + 1}: target {target:.4f}, achieved {achieved:.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,453 @@
+"""
+Exact pick probabilities for the weighted draft lottery.
+
+Every draw picks one of the seeds that has not been drawn yet with probability
+proportional to its chances. After n_picks draws the remaining seeds keep their
+standings order. The probability of a draw only depends on which seeds are
+already gone, so small lotteries are solved with dynamic programming over the
+sets of drawn seeds (stored as bit masks), one layer per pick.
+
+The number of sets grows as 2**n_teams, so bigger lotteries use the
+exponential-clock form instead: every seed gets a clock E / chances and seeds
+are drawn in the order their clocks ring. Given that seed s rings at time t,
+every other seed has rung independently with probability 1 - exp(-chances * t),
+so s's pick is a Poisson-binomial count, and integrating over t gives every
+lottery pick in O(n_teams**2 * nodes). The standings tail integrates over the
+time and seed of the last draw the same way. The integrals use the trapezoid
+rule in log time, which converges geometrically for these smooth integrands,
+so the results agree with the set solver to about 1e-12.
+"""
+
+from functools import lru_cache
+from math import comb
+
+import numpy as np
+
+from .variance import poisson_binomial
+
+# Largest league solved over every reachable set of drawn seeds. Bigger
+# leagues prune sets whose probability falls below the tolerance.
+MAX_DENSE_TEAMS = 22
+MAX_TEAMS = 62
+# A layer switches to the table once it has at least 1/DENSE_FILL as many
+# extensions as the table has masks; sparser layers are cheaper to sort.
+DENSE_FILL = 16
+# Plain lotteries with more sets of drawn seeds than DP_SETS use the clock
+# integrals; lotteries with extra rules need the sets and refuse past MAX_SETS
+DP_SETS = 1 << 16
+MAX_SETS = 1 << 22
+# Trapezoid step of the clock integrals in log time, and how far the grid
+# reaches before the fastest clock and after the slowest one
+CLOCK_STEP = 0.1
+CLOCK_LEFT = 32.0
+CLOCK_RIGHT = 6.0
+
+
+def pick_probabilities(chances, n_picks, tol=1e-12):
+    """
+    Compute the probability of every seed landing at every pick.
+
+    Args:
+        chances: Lottery weight of each seed (index 0 is the first seed)
+        n_picks: Number of picks decided by the lottery
+        tol: Probability below which sets of drawn seeds are dropped when the
+            league is larger than MAX_DENSE_TEAMS
+
+    Returns:
+        (n_teams, n_teams) float array where [seed, pick] is the probability
+        that seed ends up at pick
+    """
+    return pick_probabilities_by_picks(chances, [n_picks], tol)[n_picks]
+
+
+def pick_probabilities_by_picks(chances, n_picks_options, tol=1e-12, draw=None):
+    """
+    Pick probabilities for several lottery lengths with one shared solve.
+
+    A lottery deciding k picks runs the same first k draws as any longer one,
+    so the draw layers are computed once up to the longest lottery and the
+    standings tail is added for each requested length along the way. Plain
+    lotteries with more than DP_SETS sets of drawn seeds are integrated with
+    the clock form instead.
+
+    Args:
+        chances: Lottery weight of each seed (index 0 is the first seed)
+        n_picks_options: Numbers of picks decided by the lottery
+        tol: Probability below which sets of drawn seeds are dropped when the
+            league is larger than MAX_DENSE_TEAMS
+        draw: Optional callable (masks, weights, pick) -> draw probabilities
+            replacing draw_probabilities, for lotteries with extra rules
+
+    Returns:
+        Dict mapping each n_picks to its (n_teams, n_teams) [seed, pick] matrix
+    """
+    weights = _validated_weights(chances)
+    n_teams = len(weights)
+    wanted = {n_picks: max(min(n_picks, n_teams), 0) for n_picks in n_picks_options}
+    last_draw = max(wanted.values(), default=0)
+    if draw is None and _reachable_sets(n_teams, last_draw) > DP_SETS:
+        return _clock_probabilities_by_picks(weights, wanted)
+    _check_sets(n_teams, last_draw)
+    dense = n_teams <= MAX_DENSE_TEAMS
+    draws = np.zeros((n_teams, n_teams))
+    results = {}
+
+    masks = np.zeros(1, dtype=np.int64)
+    mass = np.ones(1)
+    for pick in range(last_draw + 1):
+        for n_picks, n_draws in wanted.items():
+            if n_draws == pick:
+                results[n_picks] = draws.copy()
+                _add_standings_tail(results[n_picks], masks, mass, n_draws)
+        if pick == last_draw:
+            break
+        step = draw_probabilities(masks, weights) if draw is None else draw(masks, weights, pick)
+        draws[:, pick] = mass @ step
+        masks, mass = _next_layer(masks, mass, step, n_teams if dense else None, tol)
+    return results
+
+
+def drawn_set_probabilities(chances, n_draws, tol=1e-12):
+    """
+    Probability of every set of seeds the first n_draws picks can draw.
+
+    Args:
+        chances: Lottery weight of each seed (index 0 is the first seed)
+        n_draws: Number of draws
+        tol: Probability below which sets are dropped when the league is
+            larger than MAX_DENSE_TEAMS
+
+    Returns:
+        (masks, mass): int64 bit masks of the drawn sets and their probabilities
+    """
+    weights = _validated_weights(chances)
+    n_teams = len(weights)
+    _check_sets(n_teams, max(min(n_draws, n_teams), 0))
+    dense = n_teams <= MAX_DENSE_TEAMS
+    masks = np.zeros(1, dtype=np.int64)
+    mass = np.ones(1)
+    for _ in range(max(min(n_draws, n_teams), 0)):
+        step = draw_probabilities(masks, weights)
+        masks, mass = _next_layer(masks, mass, step, n_teams if dense else None, tol)
+    return masks, mass
+
+
+def next_pick_probabilities(chances, n_picks, revealed):
+    """
+    Probability of each seed taking the next pick given the seeds already drawn.
+
+    Args:
+        chances: Lottery weight of each seed
+        n_picks: Number of picks decided by the lottery
+        revealed: Seeds drawn so far, in draw order
+
+    Returns:
+        (n_teams,) float array, zero for the revealed seeds
+    """
+    weights = _validated_weights(chances)
+    n_teams = len(weights)
+    revealed = _validated_revealed(revealed, n_teams)
+    mask = np.zeros(1, dtype=np.int64)
+    for seed in revealed:
+        mask |= np.int64(1) << seed
+    if len(revealed) >= n_teams:
+        return np.zeros(n_teams)
+    if len(revealed) >= n_picks:
+        # The lottery is over: the best remaining seed picks next
+        weights = np.zeros(n_teams)
+    return draw_probabilities(mask, weights)[0]
+
+
+def conditional_probabilities(chances, n_picks, revealed):
+    """
+    Exact pick probabilities given the seeds already drawn.
+
+    Once seeds are drawn the rest of the lottery is the same lottery over the
+    remaining seeds, so each reveal is answered by a solve of that
+    sub-lottery. Small remainders are solved over their at most DP_SETS sets
+    of drawn seeds and larger ones with the clock integrals, so a reveal
+    takes milliseconds for typical leagues; repeated reveals of the same
+    prefix are cached.
+
+    Args:
+        chances: Lottery weight of each seed
+        n_picks: Number of picks decided by the lottery
+        revealed: Seeds drawn so far, in draw order
+
+    Returns:
+        (n_teams, n_teams) float array where [seed, pick] is the probability
+        that seed ends up at pick given the revealed prefix
+    """
+    n_teams = len(chances)
+    revealed = _validated_revealed(revealed, n_teams)
+
+    probabilities = np.zeros((n_teams, n_teams))
+    probabilities[revealed, np.arange(len(revealed))] = 1.0
+
+    drawn = set(revealed)
+    remaining = [seed for seed in range(n_teams) if seed not in drawn]
+    if remaining:
+        weights = tuple(float(chances[seed]) for seed in remaining)
+        sub = _remaining_probabilities(weights, max(n_picks - len(revealed), 0))
+        probabilities[np.ix_(remaining, range(len(revealed), n_teams))] = sub
+    return probabilities
+
+
+def seed_pick_probabilities(chances, n_picks, seeds, last_pick=None):
+    """
+    Pick probabilities of a few seeds, without solving the whole table.
+
+    Each row comes from the clock integrals for that seed alone: its lottery
+    picks from the seeds that rang before it, its standings picks from the
+    seeds that rang ahead of and behind it before the last draw. That costs
+    O(n_teams) array operations per seed however late the picks are, which
+    suits searches that re-solve the same few cells many times.
+
+    Args:
+        chances: Lottery weight of each seed
+        n_picks: Number of picks decided by the lottery
+        seeds: Seeds whose rows are wanted
+        last_pick: Last pick whose probability is needed (default: all); the
+            standings picks are skipped when it is a lottery pick
+
+    Returns:
+        (len(seeds), n_teams) float array where [i, pick] is the probability
+        that seeds[i] ends up at pick, zero past last_pick when skipped
+    """
+    weights = _validated_weights(chances)
+    n_teams = len(weights)
+    seeds = [int(seed) for seed in seeds]
+    if any(not 0 <= seed < n_teams for seed in seeds):
+        raise ValueError(f"Seeds must be in range({n_teams})")
+    n_draws = max(min(n_picks, n_teams), 0)
+    live = weights > 0
+    if n_draws == 0 or n_draws > live.sum():
+        # Standings order, or every live seed drawn before the dead ones
+        return _clock_probabilities_by_picks(weights, {n_picks: n_draws})[n_picks][seeds]
+
+    times, dt = _clock_grid(weights[live])
+    rung = -np.expm1(-np.outer(times, weights))
+    density = weights * np.exp(-np.outer(times, weights)) * dt[:, None]
+    # others[:, last, j]: seed j rang before the last draw, and is not it
+    others = np.repeat(rung[:, None, :], n_teams, axis=1)
+    others[:, np.arange(n_teams), np.arange(n_teams)] = 0.0
+
+    rows = np.zeros((len(seeds), n_teams))
+    for row, seed in zip(rows, seeds):
+        row[:n_draws] = density[:, seed] @ poisson_binomial(others[:, seed], n_draws - 1)
+        if n_draws == n_teams or (last_pick is not None and last_pick < n_draws):
+            continue
+        ahead = poisson_binomial(others[:, :, :seed], n_draws - 1)
+        behind = poisson_binomial(others[:, :, seed + 1:], n_draws - 1)
+        joint = ahead[:, :, ::-1] * behind * (1 - rung[:, seed, None, None])
+        jumped = np.einsum('ml,mlb->lb', density, joint)
+        jumped[seed] = 0.0
+        # Drawn seeds behind this one, the last draw included when it is behind
+        for first, by_last in ((seed, jumped[:seed]), (seed + 1, jumped[seed + 1:])):
+            slots = min(n_draws, n_teams - first)
+            row[first:first + slots] += by_last.sum(axis=0)[:slots]
+    return rows
+
+
+@lru_cache(maxsize=128)
+def _remaining_probabilities(weights, n_picks):
+    """Memoized solve of the lottery over the remaining seeds."""
+    probabilities = pick_probabilities(weights, n_picks)
+    probabilities.setflags(write=False)
+    return probabilities
+
+
+def _validated_revealed(revealed, n_teams):
+    """Revealed seeds as a list, checked to be distinct seeds of the league."""
+    revealed = list(revealed)
+    if len(set(revealed)) != len(revealed) or any(not 0 <= seed < n_teams for seed in revealed):
+        raise ValueError(f"Revealed seeds must be distinct seeds in range({n_teams})")
+    return revealed
+
+
+def _validated_weights(chances):
+    """Chances as a float array, checked against the solver's limits."""
+    weights = np.asarray(chances, dtype=np.float64)
+    if len(weights) > MAX_TEAMS:
+        raise ValueError(f"Exact solver supports at most {MAX_TEAMS} teams, got {len(weights)}")
+    if (weights < 0).any():
+        raise ValueError("Chances must be non-negative")
+    return weights
+
+
+def draw_probabilities(masks, weights):
+    """
+    Probability of drawing each seed next, for each set of drawn seeds.
+
+    When every remaining seed has zero chances the lottery can never draw
+    them, so the next pick falls to the best remaining seed in standings order.
+
+    Args:
+        masks: (n_sets,) int64 bit masks of drawn seeds
+        weights: (n_teams,) float array of lottery weights
+
+    Returns:
+        (n_sets, n_teams) float array of draw probabilities
+    """
+    n_teams = len(weights)
+    drawn = (masks[:, None] >> np.arange(n_teams)) & 1
+    available = weights * (1 - drawn)
+    totals = available.sum(axis=1)
+
+    step = np.zeros_like(available)
+    live = totals > 0
+    step[live] = available[live] / totals[live, None]
+
+    stuck = np.flatnonzero(~live)
+    if stuck.size:
+        step[stuck, np.argmin(drawn[stuck], axis=1)] = 1.0
+    return step
+
+
+def _next_layer(masks, mass, step, dense_teams, tol):
+    """
+    Merge every one-seed extension of the current sets into the next layer.
+
+    Small leagues accumulate into a table over all 2**n_teams masks once the
+    layer is big enough to fill it; otherwise extensions merge with a sort.
+    Larger leagues also drop sets with less than tol probability.
+    """
+    parents, seeds = np.nonzero(step)
+    children = masks[parents] | (np.int64(1) << seeds)
+    child_mass = mass[parents] * step[parents, seeds]
+
+    if dense_teams is not None and DENSE_FILL * len(children) >= 1 << dense_teams:
+        table = np.bincount(children, weights=child_mass, minlength=1 << dense_teams)
+        masks = np.flatnonzero(table)
+        return masks, table[masks]
+
+    masks, inverse = np.unique(children, return_inverse=True)
+    mass = np.bincount(inverse, weights=child_mass, minlength=len(masks))
+    if dense_teams is not None:
+        return masks, mass
+    keep = mass >= tol
+    return masks[keep], mass[keep]
+
+
+def _add_standings_tail(probabilities, masks, mass, n_draws):
+    """Place the seeds left after the lottery in standings order."""
+    n_teams = probabilities.shape[0]
+    undrawn = 1 - ((masks[:, None] >> np.arange(n_teams)) & 1)
+    slots = n_draws + np.cumsum(undrawn, axis=1) - undrawn
+
+    sets, seeds = np.nonzero(undrawn)
+    cells = seeds * n_teams + slots[sets, seeds]
+    probabilities += np.bincount(
+        cells, weights=mass[sets], minlength=n_teams * n_teams
+    ).reshape(n_teams, n_teams)
+
+
+def _reachable_sets(n_teams, n_draws):
+    """Upper bound on the sets of drawn seeds the set solver visits."""
+    return sum(comb(n_teams, k) for k in range(n_draws + 1))
+
+
+def _check_sets(n_teams, n_draws):
+    """Refuse set solves that cannot finish in reasonable time."""
+    if _reachable_sets(n_teams, n_draws) > MAX_SETS:
+        raise ValueError(f"{n_draws} draws from {n_teams} teams are too many to solve over sets of drawn "
+                         f"seeds; simulate instead")
+
+
+def _clock_probabilities_by_picks(weights, wanted):
+    """Pick probabilities of every requested lottery length from the clock integrals."""
+    n_teams = len(weights)
+    live = np.flatnonzero(weights > 0)
+    dead = np.flatnonzero(weights == 0)
+    n_live = len(live)
+    times, dt = _clock_grid(weights[live]) if n_live else (np.zeros(0), np.zeros(0))
+    # Lottery picks are shared by every length; a lottery longer than the
+    # live seeds draws all of them first
+    lottery = _clock_lottery(weights, times, dt, min(max(wanted.values(), default=0), n_live))
+
+    results = {}
+    for n_picks, n_draws in wanted.items():
+        probabilities = np.zeros((n_teams, n_teams))
+        if n_draws > n_live:
+            # Every live seed is drawn, then nobody has chances left and the
+            # dead seeds pick in standings order
+            probabilities[np.ix_(live, range(n_live))] = lottery[live, :n_live]
+            probabilities[dead, n_live + np.arange(len(dead))] = 1.0
+        else:
+            probabilities[:, :n_draws] = lottery[:, :n_draws]
+            if n_draws < n_teams:
+                probabilities += _clock_tail(weights, times, dt, n_draws)
+        results[n_picks] = probabilities
+    return results
+
+
+def _clock_grid(live_weights):
+    """Trapezoid nodes in log time covering every live clock, and their weights."""
+    log_times = np.arange(np.log(1 / live_weights.max()) - CLOCK_LEFT,
+                          np.log(1 / live_weights.min()) + CLOCK_RIGHT, CLOCK_STEP)
+    times = np.exp(log_times)
+    return times, CLOCK_STEP * times
+
+
+def _clock_lottery(weights, times, dt, n_draws):
+    """
+    Probability of each seed being drawn at each of the first n_draws picks.
+
+    Seed s is drawn at pick k when its clock rings at t and exactly k other
+    clocks rang before t.
+    """
+    n_teams = len(weights)
+    if n_draws == 0:
+        return np.zeros((n_teams, 0))
+    rung = -np.expm1(-np.outer(times, weights))
+    others = np.repeat(rung[:, None, :], n_teams, axis=1)
+    others[:, np.arange(n_teams), np.arange(n_teams)] = 0.0
+    density = weights * np.exp(-np.outer(times, weights)) * dt[:, None]
+    return np.einsum('ms,msk->sk', density, poisson_binomial(others, n_draws - 1))
+
+
+def _clock_tail(weights, times, dt, n_draws):
+    """
+    Probability of each undrawn seed landing at each standings pick.
+
+    Given the seed L drawn last and its time t, every other clock rang before
+    t independently, and an undrawn seed s picks at its standings slot plus
+    the number of drawn seeds placed behind it. Prefix and suffix
+    Poisson-binomial tables count the rung seeds ahead of and behind every s
+    at once.
+    """
+    n_teams = len(weights)
+    if n_draws == 0:
+        return np.eye(n_teams)
+    seeds = np.arange(n_teams)
+    rung_all = -np.expm1(-np.outer(times, weights))
+    density = weights * np.exp(-np.outer(times, weights)) * dt[:, None]
+    probabilities = np.zeros((n_teams, n_teams))
+
+    for last in np.flatnonzero(weights > 0):
+        rung = rung_all.copy()
+        rung[:, last] = 0.0
+        # ahead[:, s, a]: a of the seeds placed ahead of s rang;
+        # behind[:, s, b]: b of the seeds placed behind s rang
+        ahead = np.zeros((len(times), n_teams, n_draws))
+        behind = np.zeros((len(times), n_teams, n_draws))
+        ahead[:, 0, 0] = 1.0
+        behind[:, -1, 0] = 1.0
+        for s in range(1, n_teams):
+            q = rung[:, s - 1, None]
+            ahead[:, s] = ahead[:, s - 1] * (1 - q)
+            ahead[:, s, 1:] += ahead[:, s - 1, :-1] * q
+        for s in range(n_teams - 2, -1, -1):
+            q = rung[:, s + 1, None]
+            behind[:, s] = behind[:, s + 1] * (1 - q)
+            behind[:, s, 1:] += behind[:, s + 1, :-1] * q
+
+        # n_draws - 1 - b seeds ahead and b behind rang, s did not
+        joint = ahead[:, :, ::-1] * behind * (1 - rung)[:, :, None]
+        jumped = np.einsum('m,msb->sb', density[:, last], joint)
+        jumped[last] = 0.0
+        slots = seeds[:, None] + np.arange(n_draws) + (last > seeds)[:, None]
+        valid = slots < n_teams
+        np.add.at(probabilities, (np.broadcast_to(seeds[:, None], slots.shape)[valid], slots[valid]),
+                  jumped[valid])
+    return probabilities
@@ -0,0 +1,103 @@
+"""
+Gumbel-top-k sampling of whole batches of draft orders.
+
+Adding independent Gumbel noise to the log-weights and sorting each row in
+descending order yields a weighted draw without replacement, so a batch of
+lotteries is one noise matrix plus one argsort per row, with no Python loop
+over picks; a partial lottery then refills the columns after the drawn seeds
+with the undrawn seeds in standings order. The keys are computed in the
+equivalent exponential form E / w (E ~ Exp(1), i.e. exp(-(log w + Gumbel)))
+sorted ascending, which saves two logarithms per cell. Seeds with no chances get an infinite key and
+fall behind every drawn seed in standings order, matching the other engines.
+"""
+
+import random
+
+import numpy as np
+
+from .lottery_simulator import order_counts
+
+CHUNK_SIZE = 1000000
+
+
+class GumbelSampler():
+    """
+    Vectorized lottery engine based on the Gumbel-top-k trick.
+
+    Has the same play_lottery/play_lottery_batch interface as Simulator and,
+    given Simulator.effective_chances, the same distribution of draft orders.
+    """
+
+    def __init__(self, n_picks, chances, seed=None):
+        self.n_picks = n_picks
+        self.chances = [float(c) for c in chances]
+        self.random = random.Random(seed)
+
+        self.len_ch = len(self.chances)
+        self.seeds = [x for x in range(self.len_ch)]
+        self.n_draws = min(self.n_picks, self.len_ch)
+
+        with np.errstate(divide='ignore'):
+            self.inverse_weights = 1 / np.asarray(self.chances, dtype=np.float32)
+        self.zero_weights = np.isinf(self.inverse_weights)
+        # Infinite keys tie, so keep standings order among them with a stable sort
+        self.sort_kind = 'stable' if self.zero_weights.any() else None
+        # Once every seed with chances is drawn the rest go in standings
+        # order, which is what the full sort gives
+        self.full_sort = self.n_draws >= min(self.len_ch, int((~self.zero_weights).sum()))
+        self.small_dtype = np.int8 if self.len_ch < np.iinfo(np.int8).max else np.int16
+        self.undrawn_start = np.arange(self.len_ch - self.n_draws, dtype=self.small_dtype)
+
+    def play_lottery(self):
+        rng = np.random.default_rng(self.random.getrandbits(64))
+        return self.play_lottery_batch(1, rng)[0].tolist()
+
+    def play_lottery_batch(self, n_iters, rng=None):
+        """
+        Play many lotteries at once.
+
+        Args:
+            n_iters: Number of lotteries to play
+            rng: numpy Generator or seed used for the noise
+
+        Returns:
+            (n_iters, n_teams) int array, one draw order per row
+        """
+        rng = np.random.default_rng(rng)
+        keys = rng.standard_exponential((n_iters, self.len_ch), dtype=np.float32)
+        keys *= self.inverse_weights
+        # A zero exponential draw times an infinite inverse weight is NaN
+        keys[:, self.zero_weights] = np.inf
+
+        if self.full_sort:
+            return np.argsort(keys, axis=1, kind=self.sort_kind)
+
+        # The n_draws smallest keys are the drawn seeds; every other column is
+        # overwritten with the undrawn seeds in standings order. Starting from
+        # 0, 1, 2, ... and stepping past each drawn seed in ascending order
+        # skips exactly the drawn ones, in a few small-int passes.
+        order = np.argsort(keys, axis=1)
+        drawn = np.sort(order[:, :self.n_draws], axis=1).astype(self.small_dtype)
+        rest = np.tile(self.undrawn_start, (n_iters, 1))
+        for pick in range(self.n_draws):
+            rest += rest >= drawn[:, pick, None]
+        order[:, self.n_draws:] = rest
+        return order
+
+    def play_lottery_counts(self, n_iters, rng=None, chunk_size=CHUNK_SIZE):
+        """
+        Count [seed, pick] outcomes of n_iters lotteries in bounded memory.
+
+        Args:
+            n_iters: Number of lotteries to play
+            rng: numpy Generator or seed used for the noise
+            chunk_size: Lotteries generated per chunk
+
+        Returns:
+            (n_teams, n_teams) int64 array of counts
+        """
+        rng = np.random.default_rng(rng)
+        counts = np.zeros((self.len_ch, self.len_ch), dtype=np.int64)
+        for start in range(0, n_iters, chunk_size):
+            counts += order_counts(self.play_lottery_batch(min(chunk_size, n_iters - start), rng), self.len_ch)
+        return counts
@@ -1,49 +1,222 @@
 import os
 
 import numpy as np
-import pandas as pd
 
+from .convergence import run_until_converged
+from .exact import conditional_probabilities, next_pick_probabilities, pick_probabilities
+from .gumbel_sampler import GumbelSampler
 from .lottery_simulator import Simulator
+from .odds_cache import OddsCache
+from .orders import top_orders
+from .ownership import PickOwnership
+from .parallel import simulate_counts
+from .season import SeasonLottery
+from .variance import run_variance_reduced
+from .weighted_sampler import WeightedSampler
 from config.config_manager import config
 from config.paths import get_app_dir
 
+ENGINES = ('balls', 'weighted', 'gumbel')
+
+
+def default_chances(n_teams, max_chance=200, min_chance=7):
+    # Generate chances based on standings (reverse order - worst team gets most chances)
+    # This creates a decreasing sequence of chances
+    if n_teams > 0:
+        step = (max_chance - min_chance) / (n_teams - 1) if n_teams > 1 else 0
+        return [int(max_chance - i * step) for i in range(n_teams)]
+    return []
+
+
+def build_sampler(engine, sim, seed=None):
+    # Every engine draws from the balls the simulator actually assigned
+    if engine == 'balls':
+        return sim
+    if engine == 'weighted':
+        return WeightedSampler(sim.n_picks, sim.effective_chances, seed=seed)
+    if engine == 'gumbel':
+        return GumbelSampler(sim.n_picks, sim.effective_chances, seed=seed)
+    raise ValueError(f"Unknown lottery engine '{engine}', expected one of {ENGINES}")
+
+
 class LotterySim():
-    def __init__(self):
-        # Load configuration from config manager
-        self.n_picks = config.number_of_teams
+    def __init__(self, seed=None, engine='balls', owner_names=None, n_picks=None, chances=None, rules=None,
+                 traded_picks=None):
+        self.seed = seed
+        self.engine = engine
+        self.cache = OddsCache()
+        self.lastCacheKey = None
+        # Load configuration from config manager unless a league is given
+        self.n_picks = config.number_of_teams if n_picks is None else n_picks
         self.n_balls = 4
-        self.places = config.owner_names
+        self.places = list(config.owner_names if owner_names is None else owner_names)
         self.places.reverse()
-        # Generate chances based on standings (reverse order - worst team gets most chances)
-        # This creates a decreasing sequence of chances
-        if len(self.places) > 0:
-            max_chance = 200
-            min_chance = 7
-            step = (max_chance - min_chance) / (len(self.places) - 1) if len(self.places) > 1 else 0
-            self.chances = [int(max_chance - i * step) for i in range(len(self.places))]
+        # Traded picks (see lottery.ownership) decide who holds each seed's pick;
+        # they are only checked once holder odds are asked for
+        if traded_picks is None and owner_names is None:
+            traded_picks = config.traded_picks
+        self.traded_picks = traded_picks
+        # Designed chances (see lottery.designer) replace the default ramp
+        self.chances = default_chances(len(self.places)) if chances is None else list(chances)
+        # Draft rules (see lottery.rules) replace the plain draw of every engine
+        if rules is None and owner_names is None and config.lottery_rules:
+            from .batch import league_rules
+            rules = league_rules({"lottery_rules": config.lottery_rules}, len(self.places), self.n_picks)
+        self.rules = rules
+        if rules is not None:
+            self.n_picks = rules.lottery_picks
+
+        self.sim = Simulator(self.n_picks, self.n_balls, self.chances, seed=self.seed)
+        if rules is None:
+            self.sampler = build_sampler(self.engine, self.sim, seed=self.seed)
+        else:
+            self.sampler = rules.compile(self.sim.effective_chances, seed=self.seed)
+
+    def runSampleSim(self, tol=0.01, time_budget=None):
+        result = run_until_converged(self.sampler.play_lottery_batch, len(self.places), tol=tol,
+                                     time_budget=time_budget, rng=self.seed)
+        print(f"Sample simulation: {result.n_iters} lotteries, max CI width {result.ci_width.max():.4f}")
+        self.writeProbabilities(result.probabilities)
+        return result
+
+    def runVarianceReducedSim(self, tol=0.01, time_budget=None):
+        self.requirePlainLottery("Variance-reduced simulation")
+        result = run_variance_reduced(self.sim.effective_chances, self.n_picks, tol=tol,
+                                      time_budget=time_budget, rng=self.seed)
+        print(f"Variance-reduced simulation: {result.n_iters} samples, max CI width {result.ci_width.max():.4f}, "
+              f"{result.speedup:.0f}x fewer than plain sampling")
+        self.writeProbabilities(result.probabilities)
+        return result
+
+    def runParallelSim(self, iters, workers=None):
+        probabilities = self.parallelProbabilities(iters, workers)
+        self.writeProbabilities(probabilities)
+        return probabilities
+
+    def parallelProbabilities(self, iters, workers=None):
+        def compute():
+            counts = simulate_counts(self.sampler.play_lottery_batch, len(self.places), iters,
+                                     seed=self.seed, workers=workers)
+            return counts / iters
+
+        # Unseeded runs are not reproducible, so only seeded ones are cached
+        if self.seed is None:
+            return compute()
+        return self.cachedProbabilities(compute, engine=self.engine, iters=iters, seed=self.seed)
+
+    def runExactSim(self):
+        probabilities = self.exactProbabilities()
+        # The CSV only changes with the odds, owners or chances, so a repeat
+        # launch leaves the file from the previous one in place
+        stamp = self.cache.key(odds=self.lastCacheKey, places=self.places, chances=list(self.chances))
+        if self.readProbabilitiesStamp() != stamp:
+            self.writeProbabilities(probabilities, stamp)
+        return probabilities
+
+    def exactProbabilities(self):
+        # Exact odds for the balls the simulator actually assigned to each seed
+        if self.rules is not None:
+            return self.cachedProbabilities(self.sampler.exact_probabilities, engine='exact')
+        return self.cachedProbabilities(
+            lambda: pick_probabilities(self.sim.effective_chances, self.n_picks), engine='exact'
+        )
+
+    def nextPickOdds(self, revealed_owners):
+        # Each remaining owner's chance of being revealed next, cheap enough for the GUI thread
+        revealed = [self.places.index(owner) for owner in revealed_owners]
+        if self.rules is not None:
+            probabilities = self.sampler.next_pick_probabilities(revealed)
         else:
-            self.chances = []
+            probabilities = next_pick_probabilities(self.sim.effective_chances, self.n_picks, revealed)
+        return {self.places[seed]: probabilities[seed] for seed in self.sim.seeds if seed not in revealed}
+
+    def remainingOdds(self, revealed_owners):
+        # Exact pick odds of the remaining owners given the owners revealed so far,
+        # indexed from the next pick on
+        self.requirePlainLottery("Remaining odds")
+        revealed = [self.places.index(owner) for owner in revealed_owners]
+        probabilities = conditional_probabilities(self.sim.effective_chances, self.n_picks, revealed)
+        remaining = [seed for seed in self.sim.seeds if seed not in revealed]
+        return {self.places[seed]: probabilities[seed, len(revealed):] for seed in remaining}
+
+    def topOrders(self, k=None, mass=None):
+        # Most likely complete draft orders as owner names, best first
+        self.requirePlainLottery("Top orders")
+        return [([self.places[seed] for seed in order], probability)
+                for order, probability in top_orders(self.sim.effective_chances, self.n_picks, k, mass)]
+
+    def holderProbabilities(self):
+        # Exact [holder, pick] odds after traded picks, holders in pickOwnership().holders order
+        return self.pickOwnership().pick_probabilities(self.exactProbabilities())
+
+    def holderTopPickOdds(self, k=3, iters=None):
+        # Distribution of how many top-k picks each holder gets: exact, or from iters simulated lotteries
+        if iters is not None:
+            return self.pickOwnership().simulated_top_pick_distribution(self.sampler.play_lottery_batch,
+                                                                        iters, k, rng=self.seed)
+        self.requirePlainLottery("Exact top-pick odds")
+        return self.pickOwnership().exact_top_pick_distribution(self.sim.effective_chances, self.n_picks, k)
+
+    def pickOwnership(self):
+        return PickOwnership.from_places(self.places, self.traded_picks)
+
+    def seasonProbabilities(self, season, iters, workers=None):
+        # [owner, pick] odds after simulating the rest of the season, owners in config order
+        if season.owner_names != self.places[::-1]:
+            raise ValueError("Season simulator owners must match the lottery's owners in config order")
+        return SeasonLottery(season, self.sampler.play_lottery_batch).slot_probabilities(
+            iters, seed=self.seed, workers=workers)
+
+    def requirePlainLottery(self, feature):
+        if self.rules is not None:
+            raise ValueError(f"{feature} is only available for lotteries without extra rules")
+
+    def cachedProbabilities(self, compute, **params):
+        # Effective chances never depend on the seed, so repeat launches hit the same key
+        if self.rules is not None:
+            params['rules'] = self.rules.key()
+        key = self.cache.key(chances=self.sim.effective_chances, n_picks=self.n_picks,
+                             n_balls=self.n_balls, **params)
+        self.lastCacheKey = key
+        probabilities = self.cache.get(key)
+        if probabilities is None:
+            probabilities = compute()
+            self.cache.put(key, probabilities)
+        return probabilities
+
+    def readProbabilitiesStamp(self):
+        # Stamp of the odds the CSV was last written from, or None without a CSV
+        output_dir = os.path.join(get_app_dir(), "example_result")
+        if not os.path.exists(os.path.join(output_dir, "conditional_probabilities.csv")):
+            return None
+        try:
+            with open(os.path.join(output_dir, "conditional_probabilities.key")) as f:
+                return f.read().strip()
+        except OSError:
+            return None
 
-        self.sim = Simulator(self.n_picks, self.n_balls, self.chances)
+    def writeProbabilities(self, probabilities, stamp=None):
+        # pandas is only needed for the CSV, so keep it off the import path
+        import pandas as pd
 
-    def runSampleSim(self):
-        iters = 100
-        lottery_simulation = np.array([self.sim.play_lottery() for _ in range(iters)])
         df = pd.DataFrame({'seeds': np.array(self.sim.seeds) + 1, 'chances': self.chances}).set_index('seeds')
 
         for i in range(len(self.places)):
             print(self.places[i])
-            df[self.places[i]] = (np.round(np.bincount(lottery_simulation[:, i], minlength=len(self.places)) / len(lottery_simulation), 3))
+            df[self.places[i]] = np.round(probabilities[:, i], 3)
         try:
             output_dir = os.path.join(get_app_dir(), "example_result")
             os.makedirs(output_dir, exist_ok=True)
             df.to_csv(os.path.join(output_dir, 'conditional_probabilities.csv'))
+            if stamp is not None:
+                with open(os.path.join(output_dir, 'conditional_probabilities.key'), 'w') as f:
+                    f.write(stamp)
         except Exception as e:
             print(f"Warning: Could not write sample simulation CSV: {e}")
 
     def runSim(self):
         iters = 1
-        lottery_simulation = np.array([self.sim.play_lottery() for _ in range(iters)])
+        lottery_simulation = np.array([self.sampler.play_lottery() for _ in range(iters)])
 
         pickOrder = []
         for i in range(len(lottery_simulation[0])):
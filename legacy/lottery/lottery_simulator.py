@@ -1,5 +1,8 @@
-from itertools import combinations
-from random import sample
+import random
+from functools import cached_property
+from operator import getitem
+
+import numpy as np
 
 
 def fcomb0(n, k):
@@ -34,43 +37,244 @@ def fcomb0(n, k):
     return total_ways
 
 
+# Leagues with more combinations than this map combos to owners on the fly
+# instead of storing an owner for every combination.
+IMPLICIT_COMBS = 1 << 20
+
+
+def fit_chances(chances, n_combs):
+    """
+    Scale chances down proportionally so they fit in n_combs combinations.
+
+    Seats are handed out by largest remainder, which is what dropping the
+    surplus balls at random would give on average, but the same on every run.
+    Chances that already fit are returned unchanged.
+    """
+    chances = np.asarray(chances, dtype=np.int64)
+    total = int(chances.sum())
+    if total <= n_combs:
+        return chances
+    quotas = chances * n_combs / total
+    fitted = np.floor(quotas).astype(np.int64)
+    shortfall = n_combs - int(fitted.sum())
+    fitted[np.argsort(fitted - quotas, kind='stable')[:shortfall]] += 1
+    return fitted
+
+
+class KeyedPermutation():
+    """
+    Seeded bijection of range(size) that is computed, never stored.
+
+    A balanced Feistel network permutes the smallest power-of-four domain that
+    covers size; values that land outside range(size) are encrypted again
+    (cycle walking) until they fall inside, which keeps it a bijection.
+    """
+
+    ROUNDS = 4
+
+    def __init__(self, size, random_source):
+        self.size = size
+        self.half_bits = np.uint64(max(1, ((size - 1).bit_length() + 1) // 2))
+        self.mask = np.uint64((1 << int(self.half_bits)) - 1)
+        self.keys = [np.uint64(random_source.getrandbits(64)) for _ in range(self.ROUNDS)]
+
+    def _encrypt(self, values):
+        left = values >> self.half_bits
+        right = values & self.mask
+        for key in self.keys:
+            mixed = (right ^ key) * np.uint64(0x9E3779B97F4A7C15)
+            mixed ^= mixed >> np.uint64(29)
+            left, right = right, left ^ (mixed & self.mask)
+        return (left << self.half_bits) | right
+
+    def __call__(self, values):
+        """Permuted position of each value in range(size)."""
+        values = np.asarray(values)
+        permuted = self._encrypt(np.atleast_1d(values).astype(np.uint64))
+        outside = np.flatnonzero(permuted >= self.size)
+        while outside.size:
+            permuted[outside] = self._encrypt(permuted[outside])
+            outside = outside[permuted[outside] >= self.size]
+        return permuted.astype(np.int64).reshape(values.shape)
+
+
 class Simulator():
-    def __init__(self, n_picks, n_balls, chances):
+    def __init__(self, n_picks, n_balls, chances, seed=None, implicit=None):
         self.n_picks = n_picks
         self.n_balls = n_balls
         self.chances = chances
+        self.random = random.Random(seed)
 
         self.len_ch = len(self.chances)
         self.seeds = [x for x in range(self.len_ch)]
 
-        self.combs = [cmb for cmb in combinations(self.seeds, self.n_balls)]
+        self.n_combs = fcomb0(self.len_ch, self.n_balls)
+        self.implicit = self.n_combs > IMPLICIT_COMBS if implicit is None else implicit
+
+        # binoms[i][c] = C(c, i + 1), so the colex rank of a sorted combo
+        # (c_0 < c_1 < ...) is sum(binoms[i][c_i]) and every rank in
+        # range(n_combs) is exactly one combo. Plain ints keep the scalar
+        # draw free of numpy scalar overhead.
+        self.binoms = tuple(tuple(fcomb0(c, i + 1) for c in range(self.len_ch)) for i in range(self.n_balls))
+
+        if self.implicit:
+            # A keyed permutation sends each combo rank to a position and each
+            # seed owns a run of positions, so the owner is a threshold lookup.
+            self.permutation = KeyedPermutation(self.n_combs, self.random)
+            self.thresholds = np.cumsum(fit_chances(self.chances, self.n_combs))
+            self.owners = None
+            return
+
+        # One ball per chance, trimmed to fit like the implicit mode, padded
+        # with the "unassigned" owner len_ch and shuffled over the combo ranks.
+        # Only the shuffle is random, so the effective chances (and every
+        # exact odds table) are the same on every launch.
+        fitted = fit_chances(self.chances, self.n_combs)
+        balls = np.repeat(np.arange(self.len_ch + 1), list(fitted) + [self.n_combs - int(fitted.sum())])
+        shuffle = np.random.default_rng(self.random.getrandbits(128))
+        owner_dtype = np.int8 if self.len_ch < np.iinfo(np.int8).max else np.int16
+        self.owners = shuffle.permutation(balls).astype(owner_dtype)
+
+    @cached_property
+    def effective_chances(self):
+        """
+        Number of combinations actually assigned to each seed.
+
+        Matches chances unless they add up to more than the available
+        combinations, in which case every seed's chances were scaled down to
+        fit with fit_chances.
+        """
+        if self.implicit:
+            return np.diff(self.thresholds, prepend=0)
+        return np.bincount(self.owners, minlength=self.len_ch + 1)[:self.len_ch]
+
+    def owners_of(self, ranks):
+        """Seed that owns each combo rank, or len_ch if unassigned."""
+        if not self.implicit:
+            return self.owners[ranks]
+        return np.searchsorted(self.thresholds, self.permutation(ranks), side='right')
 
-        self.winning_seeds = list()
-        for seed in self.seeds:
-            self.winning_seeds += self.chances[seed] * [seed]
-        self.winning_seeds += [self.len_ch] * (int(fcomb0(self.len_ch, self.n_balls)) - sum(self.chances))
-        self.win_seeds = sample(self.winning_seeds, len(self.winning_seeds))
+    @cached_property
+    def owner_list(self):
+        """Owner array as a Python list, for the scalar draw's one-at-a-time lookups."""
+        return self.owners.tolist()
 
-        self.hashtable = dict(zip(self.combs, self.win_seeds))
+    def rank(self, combo):
+        """Colex rank of a sorted combination of seeds."""
+        return sum(map(getitem, self.binoms, combo))
+
+    def rank_owner(self, rank):
+        """Seed that owns one combo rank, or len_ch if unassigned."""
+        if self.implicit:
+            return int(self.owners_of(rank))
+        return self.owner_list[rank]
+
+    def owner(self, combo):
+        """Seed that owns a sorted combination, or len_ch if unassigned."""
+        return self.rank_owner(self.rank(combo))
 
     def lottery(self):
-        return tuple(sorted(sample(self.seeds, self.n_balls)))
+        return tuple(sorted(self.random.sample(self.seeds, self.n_balls)))
 
     def play_lottery(self):
         order = [x for x in range(self.len_ch)]
         skips = [self.len_ch]
 
+        # Balls still in play; once none are left the best remaining seed picks next
+        effective = self.effective_chances.tolist()
+        balls_left = sum(effective)
         n_draws = self.n_picks
         while n_draws:
-            draw = self.lottery()
+            if not balls_left:
+                winner = next(seed for seed in self.seeds if seed not in skips)
+            else:
+                # A uniform rank is a uniform sorted combo, without sampling balls
+                winner = self.rank_owner(self.random.randrange(self.n_combs))
 
-            if self.hashtable[draw] in skips:
-                continue
-            skips.append(self.hashtable[draw])
+                if winner in skips:
+                    continue
+            skips.append(winner)
+            balls_left -= effective[winner]
 
-            old_index = order.index(self.hashtable[draw])
+            old_index = order.index(winner)
             order.insert(self.n_picks - n_draws, order.pop(old_index))
 
             n_draws -= 1
 
         return order
+
+    def play_lottery_batch(self, n_iters, rng=None):
+        """
+        Play many lotteries at once with array operations.
+
+        Each pick draws a random combination for every iteration that still
+        needs one and redraws only the rows that hit an unassigned combo or an
+        already-drawn seed, exactly like the rejection loop in play_lottery.
+        Rows where no undrawn seed has any balls left give the pick to the
+        best remaining seed instead.
+
+        Args:
+            n_iters: Number of lotteries to play
+            rng: numpy Generator or seed used for the draws
+
+        Returns:
+            (n_iters, n_teams) int array, one draw order per row
+        """
+        rng = np.random.default_rng(rng)
+        rows = np.arange(n_iters)
+        n_draws = min(self.n_picks, self.len_ch)
+
+        # Column len_ch stands in for the "unassigned" owner and is always drawn
+        drawn = np.zeros((n_iters, self.len_ch + 1), dtype=bool)
+        drawn[:, self.len_ch] = True
+        picks = np.empty((n_iters, n_draws), dtype=np.int64)
+
+        effective = self.effective_chances
+        for pick in range(n_draws):
+            # Nobody left has balls: the best remaining seed picks next
+            stuck = (~drawn[:, :self.len_ch] @ effective) == 0
+            picks[stuck, pick] = np.argmin(drawn[stuck, :self.len_ch], axis=1)
+            pending = rows[~stuck]
+            while pending.size:
+                owners = self.owners_of(rng.integers(0, self.n_combs, pending.size))
+                hit = ~drawn[pending, owners]
+                picks[pending[hit], pick] = owners[hit]
+                pending = pending[~hit]
+            drawn[rows, picks[:, pick]] = True
+
+        return orders_from_picks(picks, self.len_ch)
+
+
+def orders_from_picks(picks, n_teams):
+    """
+    Expand the drawn seeds of each lottery into a full draft order.
+
+    Drawn seeds take the first picks in draw order and every seed that was not
+    drawn keeps its standings order behind them, as in Simulator.play_lottery.
+
+    Args:
+        picks: (n_iters, n_draws) array of drawn seeds
+        n_teams: Total number of seeds
+
+    Returns:
+        (n_iters, n_teams) int array of draft orders
+    """
+    n_iters, n_draws = picks.shape
+    slot = np.full((n_iters, n_teams), n_draws, dtype=np.int64)
+    slot[np.arange(n_iters)[:, None], picks] = np.arange(n_draws)
+    return np.argsort(slot, axis=1, kind='stable')
+
+
+def order_counts(orders, n_teams):
+    """
+    Count how often each seed lands at each pick.
+
+    Args:
+        orders: (n_iters, n_teams) array of draft orders
+        n_teams: Total number of seeds
+
+    Returns:
+        (n_teams, n_teams) int64 array where [seed, pick] is a count
+    """
+    cells = orders * n_teams + np.arange(orders.shape[1])
+    return np.bincount(cells.ravel(), minlength=n_teams * n_teams).reshape(n_teams, n_teams)
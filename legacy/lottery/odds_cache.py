@@ -0,0 +1,114 @@
+"""
+Persistent on-disk cache of computed odds tables.
+
+Each probability matrix is stored as a .npy file named after a SHA-256 hash
+of the lottery parameters that produced it, so identical parameters always
+hit the same entry. File modification times record last use; when the cache
+grows past its size cap the least recently used entries are deleted.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from config.paths import get_cache_dir
+
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def _jsonable(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot hash parameter of type {type(value).__name__}")
+
+
+class OddsCache():
+    """Content-addressed LRU cache of probability matrices."""
+
+    def __init__(self, directory=None, max_bytes=MAX_CACHE_BYTES):
+        self.directory = directory or get_cache_dir()
+        self.max_bytes = max_bytes
+
+    def key(self, **params):
+        """
+        Hash lottery parameters into a cache key.
+
+        Args:
+            **params: JSON-serialisable parameters (numpy arrays allowed)
+
+        Returns:
+            Hex digest identifying the parameters
+        """
+        payload = json.dumps(params, sort_keys=True, default=_jsonable)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npy")
+
+    def get(self, key):
+        """
+        Load a cached matrix and mark it as recently used.
+
+        Args:
+            key: Key from OddsCache.key
+
+        Returns:
+            Read-only array, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            # Read fully rather than memory-mapped, so eviction can delete the
+            # file while the matrix is in use (Windows refuses mapped files)
+            matrix = np.load(path)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        matrix.setflags(write=False)
+        return matrix
+
+    def put(self, key, matrix):
+        """
+        Store a matrix under key and evict old entries past the size cap.
+
+        Args:
+            key: Key from OddsCache.key
+            matrix: Array to store
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = self._path(key) + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                np.save(f, np.asarray(matrix))
+            os.replace(tmp_path, self._path(key))
+            self._evict()
+        except OSError as e:
+            print(f"Warning: Could not write odds cache: {e}")
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits max_bytes."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".npy"):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                continue  # Still open elsewhere; try again on the next put
+            total -= size
+
+    def clear(self):
+        """Delete every cached entry."""
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".npy"):
+                    os.remove(os.path.join(self.directory, name))
@@ -0,0 +1,150 @@
+"""
+Most likely complete draft orders, enumerated best-first.
+
+The most likely way to finish a partial order is to draw the remaining seeds
+from most to fewest chances, so a prefix's probability times that best
+completion bounds every order that extends it, and is exact for the best one.
+Orders are produced in decreasing probability by a priority queue over
+prefixes keyed by this bound. A seed with more chances is never a worse next
+draw than one with fewer, so each prefix keeps its candidates in decreasing
+weight, and popping one pushes only its best child and its next sibling. The
+queue therefore holds at most one entry more than the number of prefixes
+popped so far instead of all n! orders.
+
+Usage:
+    python -m lottery.orders config/league_config.json --top 10
+    python -m lottery.orders config/league_config.json --mass 0.05
+"""
+
+import argparse
+import heapq
+import itertools
+import sys
+
+
+def iter_orders(chances, n_picks):
+    """
+    Yield complete draft orders in decreasing probability.
+
+    Orders with zero probability are never produced.
+
+    Args:
+        chances: Lottery weight of each seed (index 0 is the first seed)
+        n_picks: Number of picks decided by the lottery
+
+    Yields:
+        (order, probability) where order[pick] is the seed at that pick
+    """
+    weights = [float(w) for w in chances]
+    n_teams = len(weights)
+    n_draws = max(min(n_picks, n_teams), 0)
+    # Seeds by decreasing weight; ties keep standings order
+    by_weight = sorted(range(n_teams), key=lambda seed: -weights[seed])
+
+    def candidates(prefix):
+        """Seeds that can be drawn next, most likely first, and their total weight."""
+        drawn = set(prefix)
+        remaining = [seed for seed in by_weight if seed not in drawn and weights[seed] > 0]
+        if not remaining:
+            # Nobody left has chances: the best remaining seed picks next
+            return [min(seed for seed in range(n_teams) if seed not in drawn)], 0.0
+        return remaining, sum(weights[seed] for seed in remaining)
+
+    def best_completion(remaining, total, n_left):
+        """Probability of drawing the next n_left seeds from most to fewest chances."""
+        probability = 1.0
+        for seed in remaining[:n_left]:
+            if total <= 0:
+                break
+            probability *= weights[seed] / total
+            total -= weights[seed]
+        return probability
+
+    def entry(prefix, position, parent_probability):
+        """Heap entry for the child at position among the prefix's candidates."""
+        remaining, total = candidates(prefix)
+        if position >= len(remaining):
+            return None
+        seed = remaining[position]
+        probability = parent_probability * (weights[seed] / total if total > 0 else 1.0)
+        rest = remaining[:position] + remaining[position + 1:]
+        bound = probability * best_completion(rest, total - weights[seed], n_draws - len(prefix) - 1)
+        return (-bound, next(counter), prefix + (seed,), position, probability, parent_probability)
+
+    counter = itertools.count()
+    if n_draws == 0:
+        yield tuple(range(n_teams)), 1.0
+        return
+
+    heap = [entry((), 0, 1.0)]
+    while heap:
+        _, _, prefix, position, probability, parent_probability = heapq.heappop(heap)
+        sibling = entry(prefix[:-1], position + 1, parent_probability)
+        if sibling is not None:
+            heapq.heappush(heap, sibling)
+
+        if len(prefix) == n_draws:
+            drawn = set(prefix)
+            yield prefix + tuple(seed for seed in range(n_teams) if seed not in drawn), probability
+        else:
+            heapq.heappush(heap, entry(prefix, 0, probability))
+
+
+def top_orders(chances, n_picks, k=None, mass=None):
+    """
+    Most likely complete draft orders.
+
+    Args:
+        chances: Lottery weight of each seed (index 0 is the first seed)
+        n_picks: Number of picks decided by the lottery
+        k: Stop after this many orders (default 10 unless mass is given)
+        mass: Stop once the orders found cover this total probability
+
+    Returns:
+        List of (order, probability) in decreasing probability
+    """
+    if k is None and mass is None:
+        k = 10
+    found = []
+    covered = 0.0
+    for order, probability in iter_orders(chances, n_picks):
+        found.append((order, probability))
+        covered += probability
+        if (k is not None and len(found) >= k) or (mass is not None and covered >= mass):
+            break
+    return found
+
+
+def build_parser():
+    """Create the argument parser for the orders CLI."""
+    parser = argparse.ArgumentParser(description="List the most likely complete draft orders.")
+    parser.add_argument("config", help="League config file")
+    parser.add_argument("--top", type=int, default=None,
+                        help="Number of orders to list (default: 10 unless --mass is given)")
+    parser.add_argument("--mass", type=float, default=None,
+                        help="Stop once the listed orders cover this probability")
+    return parser
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    from .batch import canonical_key, league_owner_names, league_rules
+    from .lottery import LotterySim
+    from config.config_manager import read_league_config
+
+    args = build_parser().parse_args(argv)
+    league = read_league_config(args.config)
+    n_teams, n_picks, _ = canonical_key(league)
+    lottery_sim = LotterySim(owner_names=league_owner_names(league), n_picks=n_picks,
+                             rules=league_rules(league, n_teams, n_picks))
+
+    orders = lottery_sim.topOrders(k=args.top, mass=args.mass)
+    covered = 0.0
+    for rank, (owners, probability) in enumerate(orders, start=1):
+        covered += probability
+        print(f"{rank:>4}  {probability:.6%}  (cumulative {covered:.4%})  {', '.join(owners)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
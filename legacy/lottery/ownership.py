@@ -0,0 +1,197 @@
+"""
+Traded-pick ownership: lottery odds per pick holder instead of per seed.
+
+Every seed's pick belongs to the owner who finished there unless it was
+traded, so one holder can own several lottery slots (or none). A
+PickOwnership maps each seed to the index of its current holder, and all
+results are remapped with one array operation:
+
+- Pick odds: the [seed, pick] matrix times a one-hot holder matrix, summing
+  the rows of the seeds each holder owns.
+- Top-k picks from simulated draw orders: one bincount over (draw, holder)
+  cells counts how many top-k picks each holder got in every draw, and a
+  second one turns those counts into per-holder distributions.
+- Top-k picks exactly: the exact solver's probabilities of the sets of seeds
+  drawn first give the same distributions without sampling.
+
+Usage:
+    python -m lottery.ownership config/league_config.json --top 3
+    python -m lottery.ownership config/league_config.json --top 3 --iters 1000000 --seed 7
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from .exact import drawn_set_probabilities
+from .parallel import BLOCK_SIZE, block_sizes
+
+
+class PickOwnership():
+    """Current holder of every seed's pick."""
+
+    def __init__(self, seed_holders, holders):
+        self.seed_holders = np.asarray(seed_holders, dtype=np.int64)
+        self.holders = list(holders)
+
+    @classmethod
+    def from_places(cls, places, traded_picks=None):
+        """
+        Build the mapping from the owners in seed order and their trades.
+
+        Args:
+            places: Owner of each seed (index 0 is the first seed)
+            traded_picks: Dict mapping an owner to whoever now holds their pick
+
+        Returns:
+            PickOwnership whose holders are the league's owners in seed order,
+            followed by any holders from outside the league
+        """
+        traded_picks = traded_picks or {}
+        unknown = set(traded_picks) - set(places)
+        if unknown:
+            raise ValueError(f"Traded picks of unknown owners {sorted(unknown)}")
+        holders = list(places)
+        for holder in traded_picks.values():
+            if holder not in holders:
+                holders.append(holder)
+        index = {holder: i for i, holder in enumerate(holders)}
+        return cls([index[traded_picks.get(owner, owner)] for owner in places], holders)
+
+    @property
+    def n_holders(self):
+        return len(self.holders)
+
+    def holder_matrix(self):
+        """(n_holders, n_seeds) one-hot matrix of which holder owns each seed's pick."""
+        matrix = np.zeros((self.n_holders, len(self.seed_holders)))
+        matrix[self.seed_holders, np.arange(len(self.seed_holders))] = 1.0
+        return matrix
+
+    def pick_probabilities(self, probabilities):
+        """
+        Remap [seed, pick] odds to [holder, pick] odds.
+
+        A holder's row is the chance of holding each pick; with several
+        seeds a row can sum to more than one.
+        """
+        return self.holder_matrix() @ probabilities
+
+    def top_pick_counts(self, orders, k):
+        """
+        Number of top-k picks each holder gets in each draw order.
+
+        Args:
+            orders: (n_iters, n_teams) int array of draw orders
+            k: Number of leading picks that count
+
+        Returns:
+            (n_iters, n_holders) int array of counts
+        """
+        n_iters = len(orders)
+        holders = self.seed_holders[orders[:, :k]]
+        cells = np.arange(n_iters)[:, None] * self.n_holders + holders
+        return np.bincount(cells.ravel(), minlength=n_iters * self.n_holders).reshape(n_iters, self.n_holders)
+
+    def top_pick_histogram(self, orders, k):
+        """
+        Tally how many draw orders gave each holder each number of top-k picks.
+
+        Returns:
+            (n_holders, k + 1) int array where [holder, count] is the number of
+            orders in which holder got exactly count of the top-k picks
+        """
+        counts = self.top_pick_counts(orders, k)
+        cells = np.arange(self.n_holders) * (k + 1) + counts
+        return np.bincount(cells.ravel(), minlength=self.n_holders * (k + 1)).reshape(self.n_holders, k + 1)
+
+    def exact_top_pick_distribution(self, chances, n_picks, k, tol=1e-12):
+        """
+        Exact distribution of how many top-k picks each holder gets.
+
+        The top k picks are the first k draws, or, in a shorter lottery, every
+        draw plus the best undrawn seeds in standings order, so the
+        probabilities of the drawn sets decide every holder's count.
+
+        Args:
+            chances: Lottery weight of each seed, e.g. Simulator.effective_chances
+            n_picks: Number of picks decided by the lottery
+            k: Number of leading picks that count
+
+        Returns:
+            (n_holders, k + 1) float array where [holder, count] is the
+            probability that holder gets exactly count of the top-k picks
+        """
+        n_teams = len(self.seed_holders)
+        k = max(min(k, n_teams), 0)
+        n_draws = min(k, max(min(n_picks, n_teams), 0))
+        masks, mass = drawn_set_probabilities(chances, n_draws, tol)
+
+        top = (masks[:, None] >> np.arange(n_teams)) & 1
+        undrawn = 1 - top
+        top |= undrawn & (np.cumsum(undrawn, axis=1) <= k - n_draws)
+        counts = top @ self.holder_matrix().T.astype(np.int64)
+
+        cells = np.arange(self.n_holders) * (k + 1) + counts
+        return np.bincount(cells.ravel(), weights=np.repeat(mass, self.n_holders),
+                           minlength=self.n_holders * (k + 1)).reshape(self.n_holders, k + 1)
+
+    def simulated_top_pick_distribution(self, sampler, n_iters, k, rng=None, block_size=BLOCK_SIZE):
+        """
+        Monte Carlo distribution of how many top-k picks each holder gets.
+
+        Args:
+            sampler: Callable (n_iters, rng) -> (n_iters, n_teams) draw orders,
+                e.g. Simulator.play_lottery_batch
+            n_iters: Number of lotteries
+            k: Number of leading picks that count
+            rng: numpy Generator or seed shared by all blocks
+            block_size: Lotteries drawn per batch
+
+        Returns:
+            (n_holders, k + 1) float array of estimated probabilities
+        """
+        rng = np.random.default_rng(rng)
+        histogram = np.zeros((self.n_holders, k + 1), dtype=np.int64)
+        for size in block_sizes(n_iters, block_size):
+            histogram += self.top_pick_histogram(sampler(size, rng), k)
+        return histogram / max(n_iters, 1)
+
+
+def build_parser():
+    """Create the argument parser for the ownership CLI."""
+    parser = argparse.ArgumentParser(description="Lottery odds per pick holder after traded picks.")
+    parser.add_argument("config", help="League config file")
+    parser.add_argument("--top", type=int, default=3, help="Leading picks that count (default: 3)")
+    parser.add_argument("--iters", type=int, default=None,
+                        help="Simulate this many lotteries instead of solving exactly")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    return parser
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    from .batch import canonical_key, league_owner_names, league_rules
+    from .lottery import LotterySim
+    from config.config_manager import read_league_config
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    league = read_league_config(args.config)
+    n_teams, n_picks, rules_key = canonical_key(league)
+    if rules_key is not None and args.iters is None:
+        parser.error("exact odds need a lottery without extra rules; pass --iters to simulate")
+    lottery_sim = LotterySim(seed=args.seed, owner_names=league_owner_names(league), n_picks=n_picks,
+                             rules=league_rules(league, n_teams, n_picks),
+                             traded_picks=league.get("traded_picks", {}))
+
+    distribution = lottery_sim.holderTopPickOdds(k=args.top, iters=args.iters)
+    expected = distribution @ np.arange(distribution.shape[1])
+    for holder, row, mean in zip(lottery_sim.pickOwnership().holders, distribution, expected):
+        print(f"{holder:>16}  at least one top-{args.top} pick {1 - row[0]:8.4%}  expected {mean:.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Process-pool execution of batch lottery simulations.
+
+The requested iterations are cut into fixed-size blocks and every block gets
+its own generator spawned from one master SeedSequence. Blocks do not depend
+on how many workers run them and integer counts add up the same in any order,
+so a master seed gives identical results for any worker count.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .lottery_simulator import order_counts
+
+BLOCK_SIZE = 50000
+
+# Sampler installed in each worker process by _init_worker
+_worker_sampler = None
+
+
+def _init_worker(sampler):
+    global _worker_sampler
+    _worker_sampler = sampler
+
+
+def _count_block(n_teams, size, seed_sequence):
+    rng = np.random.default_rng(seed_sequence)
+    return order_counts(_worker_sampler(size, rng), n_teams)
+
+
+def block_sizes(n_iters, block_size=BLOCK_SIZE):
+    """Split n_iters into full blocks plus one final partial block."""
+    full, rest = divmod(n_iters, block_size)
+    return [block_size] * full + ([rest] if rest else [])
+
+
+def simulate_counts(sampler, n_teams, n_iters, seed=None, workers=None, block_size=BLOCK_SIZE):
+    """
+    Run n_iters lotteries across a pool of worker processes.
+
+    Args:
+        sampler: Picklable callable (n_iters, rng) -> (n_iters, n_teams) array
+            of draw orders, e.g. Simulator.play_lottery_batch
+        n_teams: Number of seeds in each order
+        n_iters: Total number of lotteries
+        seed: Master seed; None draws fresh entropy
+        workers: Number of processes (defaults to os.cpu_count()); 1 runs in
+            the calling process
+        block_size: Lotteries per block of work
+
+    Returns:
+        (n_teams, n_teams) int64 array of [seed, pick] counts
+    """
+    sizes = block_sizes(n_iters, block_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    workers = min(workers or os.cpu_count() or 1, max(len(sizes), 1))
+
+    counts = np.zeros((n_teams, n_teams), dtype=np.int64)
+    if workers == 1:
+        _init_worker(sampler)
+        for size, block_seed in zip(sizes, seeds):
+            counts += _count_block(n_teams, size, block_seed)
+        return counts
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(sampler,)) as pool:
+        for block_counts in pool.map(_count_block, [n_teams] * len(sizes), sizes, seeds):
+            counts += block_counts
+    return counts
@@ -0,0 +1,224 @@
+"""
+Declarative lottery rules compiled into a batched sampler and an exact solver.
+
+The basic lottery draws n_picks seeds and lets everyone else keep standings
+order. LotteryRules adds the NBA-style variations on top of that:
+
+- lottery_picks: only the first picks are drawn, the rest follow standings
+- max_drop: no seed finishes more than this many picks below its standings
+  slot; when one more draw would make that impossible, the worst remaining
+  seed takes the current pick instead
+- protected: seeds that always keep their standings pick and sit out the draw
+
+Rules are checked once when they are built. compile() turns them into a
+CompiledLottery for a given set of chances, whose batch sampler advances
+every lottery one pick at a time with array operations, and whose exact
+evaluator runs the exact solver's dynamic program with the same rule applied
+to each layer.
+"""
+
+import numpy as np
+
+from .exact import draw_probabilities, pick_probabilities_by_picks
+from .lottery_simulator import orders_from_picks
+
+RULE_KEYS = ('lottery_picks', 'max_drop', 'protected_picks')
+
+
+class LotteryRules():
+    """Validated rule set for a league of n_teams seeds (seed 0 picks first)."""
+
+    def __init__(self, n_teams, lottery_picks=None, max_drop=None, protected=()):
+        protected = sorted(int(seed) for seed in protected)
+        if len(set(protected)) != len(protected) or any(not 0 <= seed < n_teams for seed in protected):
+            raise ValueError(f"Protected seeds must be distinct seeds in range({n_teams})")
+        lottery_picks = n_teams if lottery_picks is None else int(lottery_picks)
+        if not 0 <= lottery_picks <= n_teams:
+            raise ValueError(f"lottery_picks must be between 0 and {n_teams}, got {lottery_picks}")
+        if max_drop is not None and int(max_drop) < 0:
+            raise ValueError(f"max_drop must be non-negative, got {max_drop}")
+
+        self.n_teams = n_teams
+        self.lottery_picks = lottery_picks
+        self.max_drop = None if max_drop is None else int(max_drop)
+        self.protected = protected
+        self.unprotected = [seed for seed in range(n_teams) if seed not in set(protected)]
+
+    @classmethod
+    def from_dict(cls, n_teams, spec):
+        """
+        Build rules from a config-style dict.
+
+        Args:
+            n_teams: Number of seeds in the league
+            spec: Dict with any of 'lottery_picks', 'max_drop' and
+                'protected_picks' (1-based standings picks)
+
+        Returns:
+            LotteryRules
+        """
+        unknown = set(spec) - set(RULE_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown lottery rules {sorted(unknown)}, expected some of {RULE_KEYS}")
+        return cls(
+            n_teams,
+            lottery_picks=spec.get('lottery_picks'),
+            max_drop=spec.get('max_drop'),
+            protected=[pick - 1 for pick in spec.get('protected_picks', [])]
+        )
+
+    def key(self):
+        """Parameters identifying the rules, e.g. for OddsCache keys."""
+        return {'lottery_picks': self.lottery_picks, 'max_drop': self.max_drop, 'protected': self.protected}
+
+    def compile(self, chances, seed=None):
+        """Bind the rules to each seed's chances."""
+        return CompiledLottery(self, chances, seed=seed)
+
+
+class CompiledLottery():
+    """
+    Lottery with rules applied, over the seeds that take part in the draw.
+
+    The unprotected seeds play a smaller lottery for the unprotected picks:
+    the i-th of them has standings slot i there, and slot k stands for the
+    k-th unprotected pick of the full draft.
+    """
+
+    def __init__(self, rules, chances, seed=None):
+        chances = np.asarray(chances, dtype=np.float64)
+        if len(chances) != rules.n_teams:
+            raise ValueError(f"Expected {rules.n_teams} chances, got {len(chances)}")
+        if (chances < 0).any():
+            raise ValueError("Chances must be non-negative")
+
+        self.rules = rules
+        self.rng = np.random.default_rng(seed)
+        self.picks = np.array(rules.unprotected, dtype=np.int64)
+        self.weights = chances[self.picks]
+        self.n_seeds = len(self.picks)
+        self.n_draws = min(rules.lottery_picks, self.n_seeds)
+        if rules.max_drop is not None:
+            # Last lottery slot each seed may end up in, and a matrix that
+            # counts the undrawn seeds due by each slot
+            deadlines = np.searchsorted(self.picks, self.picks + rules.max_drop, side='right') - 1
+            self.due = np.zeros((self.n_seeds, self.n_seeds))
+            self.due[np.arange(self.n_seeds), deadlines] = 1.0
+
+    def forced(self, undrawn, pick):
+        """
+        Rows whose worst remaining seed must take this pick under max_drop.
+
+        Every seed has a deadline slot. When, for some slot, as many undrawn
+        seeds are due by it as there are slots left up to it, the pick goes to
+        the undrawn seed with the earliest deadline, i.e. the worst remaining
+        one, which keeps every deadline reachable.
+
+        Args:
+            undrawn: (n_rows, n_seeds) bool array of seeds not drawn yet
+            pick: Lottery slot being drawn
+
+        Returns:
+            (forced, lowest): bool array of forced rows and the worst
+            remaining seed of every row
+        """
+        lowest = np.argmax(undrawn, axis=1)
+        if self.rules.max_drop is None:
+            return np.zeros(len(undrawn), dtype=bool), lowest
+        # Everyone is due by the last slot, which constrains nothing
+        due_by = np.cumsum(undrawn @ self.due, axis=1)[:, pick:-1]
+        return (due_by >= np.arange(1, self.n_seeds - pick)).any(axis=1), lowest
+
+    def play_lottery_batch(self, n_iters, rng=None):
+        """
+        Play many lotteries at once.
+
+        Args:
+            n_iters: Number of lotteries to play
+            rng: numpy Generator or seed used for the draws
+
+        Returns:
+            (n_iters, n_teams) int array, one draw order per row
+        """
+        rng = np.random.default_rng(rng)
+        rows = np.arange(n_iters)
+        available = np.tile(self.weights, (n_iters, 1))
+        undrawn = np.ones((n_iters, self.n_seeds), dtype=bool)
+        picks = np.empty((n_iters, self.n_draws), dtype=np.int64)
+
+        for pick in range(self.n_draws):
+            cumulative = np.cumsum(available, axis=1)
+            totals = cumulative[:, -1]
+            chosen = (cumulative <= (rng.random(n_iters) * totals)[:, None]).sum(axis=1)
+            forced, lowest = self.forced(undrawn, pick)
+            # Nobody left has chances: the best remaining seed picks next
+            chosen = np.where(forced | (totals <= 0) | (chosen >= self.n_seeds), lowest, chosen)
+            picks[:, pick] = chosen
+            available[rows, chosen] = 0.0
+            undrawn[rows, chosen] = False
+
+        return self.full_orders(orders_from_picks(picks, self.n_seeds))
+
+    def play_lottery(self):
+        """Play one lottery and return its draw order as a list of seeds."""
+        return self.play_lottery_batch(1, self.rng)[0].tolist()
+
+    def full_orders(self, orders):
+        """Map draw orders of the unprotected seeds back onto the full draft."""
+        full = np.empty((len(orders), self.rules.n_teams), dtype=np.int64)
+        full[:, self.picks] = self.picks[orders]
+        full[:, self.rules.protected] = self.rules.protected
+        return full
+
+    def next_pick_probabilities(self, revealed):
+        """
+        Probability of each seed taking the next pick of the full draft.
+
+        Args:
+            revealed: Seeds drafted so far, in pick order
+
+        Returns:
+            (n_teams,) float array, zero for the revealed seeds
+        """
+        probabilities = np.zeros(self.rules.n_teams)
+        pick = len(revealed)
+        if pick >= self.rules.n_teams:
+            return probabilities
+        if pick in self.rules.protected:
+            probabilities[pick] = 1.0
+            return probabilities
+
+        slot = int(np.searchsorted(self.picks, pick))
+        undrawn = ~np.isin(self.picks, list(revealed))
+        forced, lowest = self.forced(undrawn[None, :], slot) if slot < self.n_draws else (None, None)
+        available = np.where(undrawn, self.weights, 0.0)
+        if slot >= self.n_draws or forced[0] or available.sum() <= 0:
+            # The best remaining seed picks next
+            probabilities[self.picks[np.argmax(undrawn)]] = 1.0
+        else:
+            probabilities[self.picks] = available / available.sum()
+        return probabilities
+
+    def exact_probabilities(self, tol=1e-12):
+        """
+        Exact probability of every seed landing at every pick.
+
+        Returns:
+            (n_teams, n_teams) float array where [seed, pick] is the probability
+            that seed ends up at pick
+        """
+        def draw(masks, weights, pick):
+            step = draw_probabilities(masks, weights)
+            undrawn = ((masks[:, None] >> np.arange(self.n_seeds)) & 1) == 0
+            forced, lowest = self.forced(undrawn, pick)
+            rows = np.flatnonzero(forced)
+            step[rows] = 0.0
+            step[rows, lowest[rows]] = 1.0
+            return step
+
+        probabilities = np.zeros((self.rules.n_teams, self.rules.n_teams))
+        probabilities[self.rules.protected, self.rules.protected] = 1.0
+        if self.n_seeds:
+            sub = pick_probabilities_by_picks(self.weights, [self.n_draws], tol, draw=draw)[self.n_draws]
+            probabilities[np.ix_(self.picks, self.picks)] = sub
+        return probabilities
@@ -0,0 +1,241 @@
+"""
+Rest-of-season standings simulation chained into the draft lottery.
+
+Mid-season the lottery seeds are not known yet, so the odds come from
+simulating the remaining schedule first. Every game is a weighted coin flip,
+played for a whole batch of seasons at once: the wins are scatter-added into a
+(n_iters, n_teams) table, tiebreaks are folded into one integer sort key and
+one argsort per batch gives every season's seeds. The same batch then runs
+through the lottery sampler, so a single pipeline call produces the owner at
+every pick of n_iters simulated drafts and fits the block-parallel runner
+unchanged.
+
+Standings rank teams by record (a tie counts as half a win), then by wins in
+remaining games against teams that finish with the same record, then by
+points_for, then by their order in the config.
+
+The optional config sections look like:
+
+    "owners": [{"owner": "Owen", "record": "9-5", "win_probability": 0.6, "points_for": 1432.5}, ...],
+    "remaining_schedule": [
+        {"home": "Owen", "away": "Dom"},
+        {"home": "Sam", "away": "Gus", "home_win_probability": 0.55}
+    ]
+
+A game without home_win_probability uses the log5 estimate from both teams'
+win_probability (default 0.5).
+
+Usage:
+    python -m lottery.season config/league_config.json --iters 1000000 --seed 7
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from .parallel import simulate_counts
+
+
+def parse_record(record):
+    """
+    Parse a 'W-L' or 'W-L-T' record string.
+
+    Returns:
+        (wins, losses, ties)
+    """
+    try:
+        parts = [int(part) for part in str(record).split("-")]
+    except ValueError:
+        parts = []
+    if len(parts) not in (2, 3) or min(parts) < 0:
+        raise ValueError(f"Expected a record like '9-5' or '9-4-1', got '{record}'")
+    return tuple(parts) if len(parts) == 3 else (parts[0], parts[1], 0)
+
+
+def log5(p_home, p_away):
+    """Chance that a team with win rate p_home beats one with win rate p_away."""
+    numerator = p_home * (1 - p_away)
+    denominator = numerator + p_away * (1 - p_home)
+    return numerator / denominator if denominator > 0 else 0.5
+
+
+class SeasonSimulator():
+    """Batched simulation of the remaining schedule into lottery seeds."""
+
+    def __init__(self, owner_names, records, games, points_for=None):
+        """
+        Args:
+            owner_names: Owners in config (standings) order
+            records: Current 'W-L[-T]' record of each owner
+            games: (home, away, home_win_probability) for each remaining game
+            points_for: Optional season points of each owner, the last stat
+                tiebreak before config order
+        """
+        self.owner_names = list(owner_names)
+        self.n_teams = len(self.owner_names)
+        if len(records) != self.n_teams:
+            raise ValueError(f"Expected {self.n_teams} records, got {len(records)}")
+        index = {owner: i for i, owner in enumerate(self.owner_names)}
+
+        home, away, p_home = [], [], []
+        for game in games:
+            h, a, p = game
+            if h not in index or a not in index or h == a:
+                raise ValueError(f"Game {h} vs {a} needs two different owners of the league")
+            if not 0 <= p <= 1:
+                raise ValueError(f"Home win probability {p} of {h} vs {a} is not between 0 and 1")
+            home.append(index[h])
+            away.append(index[a])
+            p_home.append(float(p))
+        self.home = np.array(home, dtype=np.int64)
+        self.away = np.array(away, dtype=np.int64)
+        self.p_home = np.array(p_home)
+        self.n_games = len(self.home)
+
+        # Records in half wins, so a tie is worth one
+        self.half_wins = np.array([2 * w + t for w, _, t in (parse_record(r) for r in records)], dtype=np.int64)
+        # Static tiebreak: points_for rank plus config order, better is larger
+        points = np.zeros(self.n_teams) if points_for is None else np.asarray(points_for, dtype=np.float64)
+        by_points = np.lexsort((-np.arange(self.n_teams), points))
+        self.static_rank = np.empty(self.n_teams, dtype=np.int64)
+        self.static_rank[by_points] = np.arange(self.n_teams)
+
+    @classmethod
+    def from_league(cls, owners, remaining_schedule):
+        """
+        Build the simulator from a config's owners and remaining_schedule.
+
+        Args:
+            owners: Owner dicts with 'owner', 'record' and optionally
+                'win_probability' and 'points_for'
+            remaining_schedule: Game dicts with 'home', 'away' and optionally
+                'home_win_probability'
+
+        Returns:
+            SeasonSimulator
+        """
+        names = [owner["owner"] for owner in owners]
+        strength = {owner["owner"]: float(owner.get("win_probability", 0.5)) for owner in owners}
+        games = []
+        for game in remaining_schedule:
+            home, away = game["home"], game["away"]
+            p = game.get("home_win_probability")
+            if p is None:
+                p = log5(strength.get(home, 0.5), strength.get(away, 0.5))
+            games.append((home, away, p))
+        points_for = None
+        if any("points_for" in owner for owner in owners):
+            points_for = [owner.get("points_for", 0.0) for owner in owners]
+        return cls(names, [owner["record"] for owner in owners], games, points_for)
+
+    def play_seasons(self, n_iters, rng=None):
+        """
+        Finish the season n_iters times.
+
+        Args:
+            n_iters: Number of seasons to simulate
+            rng: numpy Generator or seed used for the games
+
+        Returns:
+            (n_iters, n_teams) int array where [i, seed] is the owner (config
+            index) at that lottery seed, seed 0 being the worst team
+        """
+        rng = np.random.default_rng(rng)
+        rows = np.arange(n_iters)[:, None] * self.n_teams
+        home_won = rng.random((n_iters, self.n_games)) < self.p_home
+        winners = np.where(home_won, self.home, self.away)
+
+        half_wins = self.half_wins + 2 * np.bincount(
+            (rows + winners).ravel(), minlength=n_iters * self.n_teams
+        ).reshape(n_iters, self.n_teams)
+
+        # Head-to-head: remaining games won against teams with the same record
+        tied = half_wins[:, self.home] == half_wins[:, self.away]
+        head_to_head = np.bincount(
+            (rows + winners).ravel(), weights=tied.ravel(), minlength=n_iters * self.n_teams
+        ).reshape(n_iters, self.n_teams).astype(np.int64)
+
+        key = (half_wins * (self.n_games + 1) + head_to_head) * self.n_teams + self.static_rank
+        return np.argsort(key, axis=1)
+
+
+class SeasonLottery():
+    """Season simulation followed by the lottery, as one batch sampler."""
+
+    def __init__(self, season, sampler):
+        """
+        Args:
+            season: SeasonSimulator for the league
+            sampler: Picklable callable (n_iters, rng) -> (n_iters, n_teams)
+                draw orders of seeds, e.g. LotterySim.sampler.play_lottery_batch
+        """
+        self.season = season
+        self.sampler = sampler
+
+    def play_lottery_batch(self, n_iters, rng=None):
+        """
+        Simulate n_iters seasons and their lotteries.
+
+        Returns:
+            (n_iters, n_teams) int array where [i, pick] is the owner (config
+            index) picking there
+        """
+        rng = np.random.default_rng(rng)
+        seeds = self.season.play_seasons(n_iters, rng)
+        return np.take_along_axis(seeds, self.sampler(n_iters, rng), axis=1)
+
+    def slot_probabilities(self, n_iters, seed=None, workers=None):
+        """
+        Each owner's draft-slot distribution.
+
+        Args:
+            n_iters: Number of simulated seasons and lotteries
+            seed: Master seed; None draws fresh entropy
+            workers: Number of processes (defaults to os.cpu_count())
+
+        Returns:
+            (n_teams, n_teams) float array where [owner, pick] is the
+            probability that owner (config order) picks there
+        """
+        counts = simulate_counts(self.play_lottery_batch, self.season.n_teams, n_iters,
+                                 seed=seed, workers=workers)
+        return counts / n_iters
+
+
+def build_parser():
+    """Create the argument parser for the season CLI."""
+    parser = argparse.ArgumentParser(description="Draft-slot odds from simulating the rest of the season.")
+    parser.add_argument("config", help="League config file")
+    parser.add_argument("--iters", type=int, default=1000000, help="Seasons to simulate (default: 1000000)")
+    parser.add_argument("--engine", default="gumbel", help="Lottery engine (default: gumbel)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    return parser
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    from .batch import canonical_key, league_owner_names, league_rules
+    from .lottery import LotterySim
+    from config.config_manager import read_league_config
+
+    args = build_parser().parse_args(argv)
+    league = read_league_config(args.config)
+    n_teams, n_picks, _ = canonical_key(league)
+    lottery_sim = LotterySim(seed=args.seed, engine=args.engine, owner_names=league_owner_names(league),
+                             n_picks=n_picks, rules=league_rules(league, n_teams, n_picks))
+    season = SeasonSimulator.from_league(league.get("owners", []), league.get("remaining_schedule", []))
+
+    start = time.perf_counter()
+    probabilities = lottery_sim.seasonProbabilities(season, args.iters, workers=args.workers)
+    print(f"{args.iters} seasons and lotteries in {time.perf_counter() - start:.2f}s")
+    expected = probabilities @ np.arange(1, n_teams + 1)
+    for owner, row, mean in zip(season.owner_names, probabilities, expected):
+        print(f"{owner:>16}  first pick {row[0]:8.4%}  expected pick {mean:5.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
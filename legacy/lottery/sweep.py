@@ -0,0 +1,194 @@
+"""
+What-if sweeps over lottery parameters.
+
+Evaluates every combination of ball count, number of lottery picks and chance
+schedule in one call and returns a tidy table with one row per configuration
+and seed. Work is shared across the grid: the balls only change the odds
+through the chances the simulator can actually assign, so configurations with
+the same effective chances are solved once, and one exact solve covers every
+number of lottery picks. Distinct solves run in a process pool.
+
+Usage:
+    python -m lottery.sweep --teams 12 --balls 4 5 --picks 4 12 --ramp 200:7 --ramp 250:1
+    python -m lottery.sweep --teams 12 --chances 120,96,72,40,31,29,27,20,18,16,9,2 --output sweep.csv
+"""
+
+import argparse
+import csv
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .exact import pick_probabilities_by_picks
+from .lottery import default_chances
+from .lottery_simulator import fcomb0, fit_chances
+
+COLUMNS = ('schedule', 'n_balls', 'n_picks', 'seed', 'chances', 'effective_chances', 'expected_pick',
+           'p_first_pick', 'p_lottery_pick', 'p_drop', 'max_drop', 'p_max_drop')
+
+
+class SweepResult:
+    """Probability matrices and summary table of a sweep."""
+
+    def __init__(self, matrices, rows, n_solves, elapsed):
+        self.matrices = matrices
+        self.rows = rows
+        self.n_solves = n_solves
+        self.elapsed = elapsed
+
+    def to_dataframe(self):
+        """Summary table as a pandas DataFrame."""
+        import pandas as pd
+        return pd.DataFrame(self.rows, columns=COLUMNS)
+
+    def write_csv(self, path):
+        """Write the summary table to a CSV file."""
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(self.rows)
+        return path
+
+
+def seed_metrics(probabilities, n_picks):
+    """
+    Per-seed summary metrics of a [seed, pick] probability matrix.
+
+    A seed's standings slot is its own index; a drop means it picks later
+    than that slot because better-placed teams jumped it in the lottery. The
+    largest possible drop is the number of lottery picks, limited by the
+    picks left behind the seed.
+
+    Returns:
+        Dict of per-seed arrays: expected_pick (1-based), p_first_pick,
+        p_lottery_pick, p_drop, max_drop and p_max_drop
+    """
+    n_teams = probabilities.shape[0]
+    seeds = np.arange(n_teams)
+    n_draws = max(min(n_picks, n_teams), 0)
+    later = seeds[None, :] > seeds[:, None]
+    max_drop = np.minimum(n_draws, n_teams - 1 - seeds)
+    return {
+        'expected_pick': probabilities @ (seeds + 1),
+        'p_first_pick': probabilities[:, 0],
+        'p_lottery_pick': probabilities[:, :n_draws].sum(axis=1),
+        'p_drop': (probabilities * later).sum(axis=1),
+        'max_drop': max_drop,
+        'p_max_drop': np.where(max_drop > 0, probabilities[seeds, seeds + max_drop], 0.0),
+    }
+
+
+def _solve(chances, n_picks_options):
+    return pick_probabilities_by_picks(chances, n_picks_options)
+
+
+def sweep(n_teams, n_balls_options, n_picks_options, schedules, workers=None):
+    """
+    Evaluate every (n_balls, n_picks, schedule) configuration exactly.
+
+    Args:
+        n_teams: Number of teams in the league
+        n_balls_options: Ball counts to try
+        n_picks_options: Numbers of lottery picks to try
+        schedules: Dict mapping a schedule name to its chances (index 0 is
+            the worst team)
+        workers: Number of processes (defaults to os.cpu_count())
+
+    Returns:
+        SweepResult with matrices keyed by (schedule, n_balls, n_picks) and
+        one summary row per configuration and seed
+    """
+    start = time.perf_counter()
+    n_picks_options = sorted(set(n_picks_options))
+    for name, chances in schedules.items():
+        if len(chances) != n_teams:
+            raise ValueError(f"Schedule '{name}' has {len(chances)} chances for {n_teams} teams")
+    for n_balls in n_balls_options:
+        if not 0 < n_balls <= n_teams:
+            raise ValueError(f"Cannot draw {n_balls} balls from {n_teams} teams")
+
+    # Configurations with the same effective chances share one exact solve
+    effective = {}
+    for name, chances in schedules.items():
+        for n_balls in n_balls_options:
+            fitted = fit_chances(chances, fcomb0(n_teams, n_balls))
+            effective[name, n_balls] = tuple(int(c) for c in fitted)
+    distinct = sorted(set(effective.values()))
+
+    workers = min(workers or os.cpu_count() or 1, len(distinct))
+    if workers == 1:
+        solved = [_solve(chances, n_picks_options) for chances in distinct]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            solved = list(pool.map(_solve, distinct, [n_picks_options] * len(distinct)))
+    solutions = dict(zip(distinct, solved))
+
+    matrices = {}
+    rows = []
+    for (name, n_balls), chances in effective.items():
+        for n_picks in n_picks_options:
+            probabilities = solutions[chances][n_picks]
+            matrices[name, n_balls, n_picks] = probabilities
+            metrics = seed_metrics(probabilities, n_picks)
+            for s in range(n_teams):
+                row = {'schedule': name, 'n_balls': n_balls, 'n_picks': n_picks, 'seed': s + 1,
+                       'chances': schedules[name][s], 'effective_chances': chances[s]}
+                row.update({column: metric[s].item() for column, metric in metrics.items()})
+                rows.append(row)
+    return SweepResult(matrices, rows, len(distinct), time.perf_counter() - start)
+
+
+def parse_ramp(text):
+    """Parse a 'MAX:MIN' linear chance ramp."""
+    try:
+        max_chance, min_chance = text.split(":")
+        return int(max_chance), int(min_chance)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected MAX:MIN, got '{text}'")
+
+
+def parse_chances(text):
+    """Parse a comma-separated chance schedule."""
+    try:
+        return [int(c) for c in text.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected comma-separated integers, got '{text}'")
+
+
+def build_parser():
+    """Create the argument parser for the sweep CLI."""
+    parser = argparse.ArgumentParser(description="Compare lottery configurations with exact odds.")
+    parser.add_argument("--teams", type=int, required=True, help="Number of teams in the league")
+    parser.add_argument("--balls", type=int, nargs="+", default=[4], help="Ball counts to try (default: 4)")
+    parser.add_argument("--picks", type=int, nargs="+", default=None,
+                        help="Numbers of lottery picks to try (default: all teams)")
+    parser.add_argument("--ramp", type=parse_ramp, action="append", default=[],
+                        help="Linear chance ramp MAX:MIN from worst to best team (repeatable)")
+    parser.add_argument("--chances", type=parse_chances, action="append", default=[],
+                        help="Explicit comma-separated chances, worst team first (repeatable)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--output", default="sweep.csv", help="Summary table path (default: sweep.csv)")
+    return parser
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    args = build_parser().parse_args(argv)
+    schedules = {f"ramp_{hi}_{lo}": default_chances(args.teams, hi, lo) for hi, lo in args.ramp}
+    schedules.update({f"custom_{i + 1}": chances for i, chances in enumerate(args.chances)})
+    if not schedules:
+        schedules["ramp_200_7"] = default_chances(args.teams)
+
+    result = sweep(args.teams, args.balls, args.picks or [args.teams], schedules, workers=args.workers)
+    print(f"{len(result.matrices)} configurations, {result.n_solves} exact solves in {result.elapsed:.2f}s")
+    print(f"Summary written to {result.write_csv(args.output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,227 @@
+"""
+Variance-reduced Monte Carlo estimates of the odds table.
+
+Plain sampling scores each lottery as a 0/1 hit per (seed, pick) cell, so the
+confidence interval only shrinks as 1/sqrt(n). Here the lottery is written in
+its exponential-clock form instead: every seed gets a clock E / chances and
+the lottery draws seeds in the order their clocks ring (a clock that never
+rings, for zero chances, loses ties to better-placed seeds' clocks, i.e. the
+best remaining seed picks next). That gives two conditional estimators
+(Rao-Blackwellization), each averaging out everything but one or two numbers:
+
+- Lottery picks: given seed s's clock time t, every other seed has rung
+  independently with probability 1 - exp(-chances * t), so s's draw position
+  is a Poisson-binomial count with an exact distribution. Only t is sampled,
+  and its quantiles are stratified, so these cells converge much faster
+  than 1/sqrt(n).
+- Picks behind the lottery: given the time and seed of the last lottery draw,
+  the chance that an undrawn seed is jumped by d better-placed seeds is a
+  product of two Poisson-binomial terms, for every seed at once.
+
+Every chunk yields an unbiased estimate with its own variance estimate (two
+samples per stratum), and the runner reports the effective speedup: how many
+times more plain lotteries would give the same worst-cell interval.
+"""
+
+import time
+
+import numpy as np
+
+
+class VarianceReducedResult:
+    """Estimated odds of a variance-reduced run and how much sampling it saved."""
+
+    def __init__(self, probabilities, n_iters, ci_width, converged, elapsed, speedup):
+        self.probabilities = probabilities
+        self.n_iters = n_iters
+        self.ci_width = ci_width
+        self.converged = converged
+        self.elapsed = elapsed
+        self.speedup = speedup
+
+
+def poisson_binomial(p, max_count):
+    """
+    Distribution of the number of successes of independent trials.
+
+    Args:
+        p: (..., n_trials) success probabilities
+        max_count: Largest count whose probability is needed
+
+    Returns:
+        (..., max_count + 1) array of P(count = k); larger counts are dropped
+    """
+    pmf = np.zeros(p.shape[:-1] + (max_count + 1,))
+    pmf[..., 0] = 1.0
+    for trial in range(p.shape[-1]):
+        q = p[..., trial, None]
+        pmf[..., 1:] = pmf[..., 1:] * (1 - q) + pmf[..., :-1] * q
+        pmf[..., 0] *= 1 - q[..., 0]
+    return pmf
+
+
+class ClockEstimator:
+    """Running chunk estimates of the conditional odds table."""
+
+    def __init__(self, chances, n_picks):
+        self.weights = np.asarray(chances, dtype=np.float64)
+        if (self.weights < 0).any():
+            raise ValueError("Chances must be non-negative")
+        self.n_teams = len(self.weights)
+        self.n_draws = max(min(n_picks, self.n_teams), 0)
+        self.n_live = int((self.weights > 0).sum())
+
+        seeds = np.arange(self.n_teams)
+        self.better = seeds[None, :] < seeds[:, None]  # [s, i]: i is placed ahead of s
+        self.n_iters = 0
+        self.sums = np.zeros((self.n_teams, self.n_teams))
+        self.variance_sums = np.zeros((self.n_teams, self.n_teams))
+
+    def add_chunk(self, size, rng):
+        """Estimate the table from size samples (rounded up to an even number)."""
+        n_strata = max((size + 1) // 2, 1)
+        samples = np.zeros((2, n_strata, self.n_teams, self.n_teams))
+        if self.n_draws:
+            samples[..., :self.n_draws] = self._lottery_picks(n_strata, rng)
+        if self.n_draws < self.n_teams:
+            samples[..., self.n_draws:] = self._standings_picks(n_strata, rng)[..., self.n_draws:]
+
+        # Each chunk is its own estimate; both are weighted by sample count
+        n_samples = 2 * n_strata
+        estimate = samples.mean(axis=(0, 1))
+        variance = ((samples[0] - samples[1]) ** 2).sum(axis=0) / (4 * n_strata * n_strata)
+        self.sums += n_samples * estimate
+        self.variance_sums += n_samples * n_samples * variance
+        self.n_iters += n_samples
+
+    def _lottery_picks(self, n_strata, rng):
+        """Draw position of each seed given its own clock, two samples per stratum."""
+        quantiles = (np.arange(n_strata)[:, None] + rng.random((2, n_strata, self.n_teams))) / n_strata
+        with np.errstate(divide='ignore'):
+            times = -np.log1p(-quantiles) / self.weights
+        times = np.where(self.weights > 0, times, np.inf)
+
+        # rung[..., s, i]: seed i's clock rang before seed s's
+        with np.errstate(invalid='ignore'):
+            rung = -np.expm1(-self.weights * times[..., None])
+        never = np.isinf(times)[..., None]
+        rung = np.where(never, (self.weights > 0) | self.better, rung)
+        diagonal = np.arange(self.n_teams)
+        rung[..., diagonal, diagonal] = 0.0
+        return poisson_binomial(rung, self.n_draws - 1)
+
+    def _standings_picks(self, n_strata, rng):
+        """Chance of each undrawn seed being jumped by d better-placed seeds."""
+        picks = np.zeros((2, n_strata, self.n_teams, self.n_teams))
+        if self.n_live < self.n_draws:
+            # Every live seed is drawn, then the best dead seeds: no randomness left
+            drawn = np.zeros(self.n_teams, dtype=bool)
+            drawn[self.weights > 0] = True
+            drawn[np.flatnonzero(self.weights == 0)[:self.n_draws - self.n_live]] = True
+            undrawn = np.flatnonzero(~drawn)
+            picks[..., undrawn, self.n_draws + np.arange(len(undrawn))] = 1.0
+            return picks
+
+        with np.errstate(divide='ignore'):
+            clocks = rng.exponential(size=(2, n_strata, self.n_teams)) / self.weights
+        clocks = np.where(self.weights > 0, clocks, np.inf)
+        last = np.argpartition(clocks, self.n_draws - 1, axis=-1)[..., self.n_draws - 1]
+        cutoff = np.take_along_axis(clocks, last[..., None], axis=-1)
+
+        # Given the last lottery draw, the other seeds rang before it independently
+        rung = -np.expm1(-self.weights * cutoff)
+        np.put_along_axis(rung, last[..., None], 0.0, axis=-1)
+
+        # ahead[..., s, k]: k of the seeds placed ahead of s rang;
+        # behind[..., s, d]: d of the seeds placed behind s rang
+        ahead = np.zeros(rung.shape + (self.n_draws,))
+        behind = np.zeros(rung.shape + (self.n_draws,))
+        ahead[..., 0, 0] = 1.0
+        behind[..., -1, 0] = 1.0
+        for s in range(1, self.n_teams):
+            q = rung[..., s - 1, None]
+            ahead[..., s, :] = ahead[..., s - 1, :] * (1 - q)
+            ahead[..., s, 1:] += ahead[..., s - 1, :-1] * q
+        for s in range(self.n_teams - 2, -1, -1):
+            q = rung[..., s + 1, None]
+            behind[..., s, :] = behind[..., s + 1, :] * (1 - q)
+            behind[..., s, 1:] += behind[..., s + 1, :-1] * q
+        # Probability that exactly n_draws - 1 of the other seeds rang
+        q = rung[..., -1, None]
+        everyone = ahead[..., -1, :] * (1 - q)
+        everyone[..., 1:] += ahead[..., -1, :-1] * q
+        total = everyone[..., -1]
+
+        # An undrawn seed jumped by d better-placed seeds (plus the last draw
+        # if it is one of them) picks at its standings slot plus the jumps
+        jumped = ahead[..., ::-1] * behind * (1 - rung)[..., None] / total[..., None, None]
+        np.put_along_axis(jumped, last[..., None, None], 0.0, axis=-2)
+        seeds, drops = np.nonzero(np.arange(self.n_teams)[:, None] + np.arange(self.n_draws) < self.n_teams)
+        slots = seeds + drops + (last[..., None] > seeds)
+        # One spare column takes the impossible jumps past the last pick
+        padded = np.zeros(picks.shape[:-2] + (self.n_teams * (self.n_teams + 1),))
+        np.put_along_axis(padded, seeds * (self.n_teams + 1) + slots, jumped[..., seeds, drops], axis=-1)
+        picks[:] = padded.reshape(picks.shape[:-1] + (self.n_teams + 1,))[..., :self.n_teams]
+        return picks
+
+    @property
+    def probabilities(self):
+        """Current [seed, pick] estimate."""
+        return self.sums / max(self.n_iters, 1)
+
+    @property
+    def variance(self):
+        """Estimated variance of each cell of the estimate."""
+        return self.variance_sums / max(self.n_iters, 1) ** 2
+
+
+def effective_speedup(probabilities, variance, n_iters):
+    """
+    How many times more plain lotteries would give the same worst-cell CI.
+
+    Plain sampling has variance p(1 - p) / n per cell, and the runners stop on
+    the widest interval, so the speedup compares the widest cells.
+    """
+    naive = (probabilities * (1 - probabilities)).max() / max(n_iters, 1)
+    worst = variance.max()
+    return float(naive / worst) if worst > 0 else float('inf')
+
+
+def run_variance_reduced(chances, n_picks, tol=0.01, time_budget=None, chunk_size=10000,
+                         max_iters=None, z=1.96, rng=None):
+    """
+    Estimate the odds table until every cell's confidence interval is narrow enough.
+
+    Args:
+        chances: Lottery weight of each seed, e.g. Simulator.effective_chances
+        n_picks: Number of picks decided by the lottery
+        tol: Largest allowed confidence interval width for any cell
+        time_budget: Seconds after which the run stops even if not converged
+        chunk_size: Samples per chunk
+        max_iters: Optional cap on the total number of samples
+        z: Normal quantile of the confidence level (1.96 for 95%)
+        rng: numpy Generator or seed shared by all chunks
+
+    Returns:
+        VarianceReducedResult with the estimate, samples used, CI widths and
+        the effective speedup over plain sampling
+    """
+    rng = np.random.default_rng(rng)
+    estimator = ClockEstimator(chances, n_picks)
+    start = time.perf_counter()
+
+    while True:
+        size = chunk_size if max_iters is None else min(chunk_size, max_iters - estimator.n_iters)
+        estimator.add_chunk(size, rng)
+
+        probabilities = estimator.probabilities
+        variance = estimator.variance
+        ci_width = 2 * z * np.sqrt(variance)
+        converged = bool(ci_width.max() <= tol)
+        elapsed = time.perf_counter() - start
+        if (converged
+                or (max_iters is not None and estimator.n_iters >= max_iters)
+                or (time_budget is not None and elapsed >= time_budget)):
+            speedup = effective_speedup(probabilities, variance, estimator.n_iters)
+            return VarianceReducedResult(probabilities, estimator.n_iters, ci_width, converged,
+                                         elapsed, speedup)
@@ -0,0 +1,111 @@
+"""
+Direct weighted sampling of draft orders, without ball combinations.
+
+The combination lottery only exists to realise each seed's chances. Sampling
+the next seed straight from the remaining weights gives the same distribution
+with no rejected draws: a Fenwick tree keeps prefix sums of the remaining
+weights so each draw and removal is O(log n).
+"""
+
+import random
+
+import numpy as np
+
+from .lottery_simulator import orders_from_picks
+
+
+class FenwickTree():
+    """Binary indexed tree over non-negative weights."""
+
+    def __init__(self, weights):
+        self.size = len(weights)
+        self.tree = [0.0] * (self.size + 1)
+        for i, weight in enumerate(weights):
+            self.tree[i + 1] += weight
+            parent = i + 1 + ((i + 1) & -(i + 1))
+            if parent <= self.size:
+                self.tree[parent] += self.tree[i + 1]
+        self.total = float(sum(weights))
+
+    def add(self, index, delta):
+        """Add delta to the weight at index."""
+        self.total += delta
+        i = index + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def find(self, value):
+        """Index of the first weight whose running prefix sum exceeds value."""
+        index = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = index + step
+            if nxt <= self.size and self.tree[nxt] <= value:
+                index = nxt
+                value -= self.tree[nxt]
+            step >>= 1
+        return min(index, self.size - 1)
+
+
+class WeightedSampler():
+    """
+    Lottery engine that draws seeds directly in proportion to their chances.
+
+    Has the same play_lottery/play_lottery_batch interface as Simulator and,
+    given Simulator.effective_chances, the same distribution of draft orders.
+    """
+
+    def __init__(self, n_picks, chances, seed=None):
+        self.n_picks = n_picks
+        self.chances = [float(c) for c in chances]
+        self.random = random.Random(seed)
+
+        self.len_ch = len(self.chances)
+        self.seeds = [x for x in range(self.len_ch)]
+        self.n_draws = min(self.n_picks, self.len_ch)
+
+    def play_lottery(self):
+        tree = FenwickTree(self.chances)
+        drawn = [False] * self.len_ch
+        order = []
+
+        while len(order) < self.n_draws and tree.total > 0:
+            winner = tree.find(self.random.random() * tree.total)
+            drawn[winner] = True
+            order.append(winner)
+            tree.add(winner, -self.chances[winner])
+
+        return order + [seed for seed in self.seeds if not drawn[seed]]
+
+    def play_lottery_batch(self, n_iters, rng=None):
+        """
+        Play many lotteries at once by inverse-CDF sampling of every row.
+
+        Args:
+            n_iters: Number of lotteries to play
+            rng: numpy Generator or seed used for the draws
+
+        Returns:
+            (n_iters, n_teams) int array, one draw order per row
+        """
+        rng = np.random.default_rng(rng)
+        rows = np.arange(n_iters)
+        remaining = np.tile(np.asarray(self.chances), (n_iters, 1))
+        drawn = np.zeros((n_iters, self.len_ch), dtype=bool)
+        picks = np.empty((n_iters, self.n_draws), dtype=np.int64)
+
+        for pick in range(self.n_draws):
+            cumulative = np.cumsum(remaining, axis=1)
+            targets = rng.random(n_iters) * cumulative[:, -1]
+            winners = (cumulative <= targets[:, None]).sum(axis=1)
+
+            # Rows with no weight left fall back to the best remaining seed
+            stuck = cumulative[:, -1] <= 0
+            winners[stuck] = np.argmin(drawn[stuck], axis=1)
+
+            picks[:, pick] = winners
+            remaining[rows, winners] = 0.0
+            drawn[rows, winners] = True
+
+        return orders_from_picks(picks, self.len_ch)
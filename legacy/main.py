@@ -4,16 +4,66 @@ Main application file for the Fantasy Football Lottery GUI.
 
 import sys
 
+from startup_profile import profiler_from_argv
+
+# Installed before the heavy imports below so their cost is measured
+profiler = profiler_from_argv(sys.argv)
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtWidgets import QApplication, QHBoxLayout, QMainWindow, QVBoxLayout, QAction
 
+from config.config_manager import config
 from widgets.layout_colorwidget import Color
-from lottery.lottery import LotterySim
 from widgets.header_widget import HeaderWidget
 from widgets.draft_order_widget import DraftOrderWidget
 from widgets.lottery_window_widget import LotteryWindowWidget
 from widgets.standings_widget import StandingsWidget
 from widgets.draft_pick_selector_widget import DraftPickSelectorWidget
-from widgets.config_widget import ConfigWidget
+from widgets.config_watcher import ConfigWatcher
+
+
+class LotteryWorkerSignals(QObject):
+    """
+    Signals emitted by LotteryWorker.
+
+    Signals:
+        draw_ready: Emitted with the drawn pick order as soon as it exists
+        odds_ready: Emitted with the odds probability matrix once computed
+        failed: Emitted with an error message if the draw fails
+        odds_failed: Emitted with an error message if only the odds fail
+    """
+
+    draw_ready = pyqtSignal(list)
+    odds_ready = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    odds_failed = pyqtSignal(str)
+
+
+class LotteryWorker(QRunnable):
+    """Runs the lottery draw and odds computation off the GUI thread."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = LotteryWorkerSignals()
+        self.lottery_simulation = None
+
+    def run(self):
+        """Draw the pick order first, then compute the full odds table."""
+        try:
+            # Imported here so numpy stays off the startup path
+            from lottery.lottery import LotterySim
+
+            self.lottery_simulation = LotterySim()
+            self.signals.draw_ready.emit(self.lottery_simulation.runSim())
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+
+        # The draw stands on its own, so an odds failure only loses the odds
+        try:
+            self.signals.odds_ready.emit(self.lottery_simulation.runExactSim())
+        except Exception as e:
+            self.signals.odds_failed.emit(str(e))
 
 
 class MainWindow(QMainWindow):
@@ -22,11 +72,11 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        # Initialize lottery simulation
-        self.lottery_simulation = LotterySim()
-        self.lottery_simulation.runSampleSim()
-        self.pick_order = self.lottery_simulation.runSim()
+        # Lottery results arrive from a background worker
+        self.pick_order = []
         self.pick_number = 0
+        self.odds = None
+        self.lottery_simulation = None
 
         # Setup window
         self.setWindowTitle("West KTown Fantasy Football Lottery")
@@ -41,6 +91,64 @@ class MainWindow(QMainWindow):
         # Initialize UI
         self._setup_ui()
 
+        # Apply edits to league_config.json without a restart
+        self.config_watcher = ConfigWatcher(self)
+        self.config_watcher.config_changed.connect(self._on_config_changed)
+
+        # Start the lottery simulation in the background
+        self._start_lottery_worker()
+
+    def _start_lottery_worker(self):
+        """Run the lottery simulation on the thread pool."""
+        self.lottery_window_widget.disable_next_pick_button()
+        self.lottery_window_widget.show_remaining_odds([])
+        self.odds = None
+        self.statusBar().showMessage("Drawing lottery...")
+
+        self.lottery_worker = LotteryWorker()
+        self.lottery_worker.signals.draw_ready.connect(self._on_draw_ready)
+        self.lottery_worker.signals.odds_ready.connect(self._on_odds_ready)
+        self.lottery_worker.signals.failed.connect(self._on_lottery_failed)
+        self.lottery_worker.signals.odds_failed.connect(self._on_odds_failed)
+        QThreadPool.globalInstance().start(self.lottery_worker)
+
+    def _on_draw_ready(self, pick_order):
+        """Handle the drawn pick order; the draft can start from here."""
+        if self.sender() is not self.lottery_worker.signals:
+            return  # Result of a superseded simulation
+        self.pick_order = pick_order
+        self.lottery_simulation = self.lottery_worker.lottery_simulation
+        self.lottery_window_widget.enable_next_pick_button()
+        self.statusBar().showMessage("Computing lottery odds...")
+
+    def _on_odds_ready(self, odds):
+        """Handle the finished odds table."""
+        if self.sender() is not self.lottery_worker.signals:
+            return
+        self.odds = odds
+        self.statusBar().showMessage("Lottery odds ready", 5000)
+        if self.pick_number == 0:
+            self._show_pre_draw_odds()
+
+    def _on_lottery_failed(self, message):
+        """Handle an error raised while drawing the lottery."""
+        if self.sender() is not self.lottery_worker.signals:
+            return
+        self.statusBar().showMessage(f"Lottery simulation failed: {message}")
+
+    def _on_odds_failed(self, message):
+        """Handle an error raised while computing the odds; the draw can still go ahead."""
+        if self.sender() is not self.lottery_worker.signals:
+            return
+        self.statusBar().showMessage(f"Lottery odds failed: {message}")
+
+    def _show_pre_draw_odds(self):
+        """Show every owner's odds of the first pick and expected pick before the first reveal."""
+        places = self.lottery_simulation.places
+        expected_picks = self.odds @ range(1, self.odds.shape[1] + 1)
+        odds = [(places[seed], self.odds[seed, 0], expected_picks[seed]) for seed in range(len(places))]
+        self.lottery_window_widget.show_remaining_odds(sorted(odds, key=lambda item: item[1], reverse=True))
+
     def _setup_menu_bar(self):
         """Setup the application menu bar."""
         menubar = self.menuBar()
@@ -57,6 +165,8 @@ class MainWindow(QMainWindow):
     def _open_config(self):
         """Open the configuration window."""
         if self.config_widget is None or not self.config_widget.isVisible():
+            from widgets.config_widget import ConfigWidget
+
             self.config_widget = ConfigWidget()
             self.config_widget.config_saved.connect(self._on_config_saved)
         self.config_widget.show()
@@ -65,8 +175,28 @@ class MainWindow(QMainWindow):
 
     def _on_config_saved(self):
         """Handle configuration saved event."""
-        # You could reload the application or update specific components here
-        pass
+        # The watcher normally catches this too; reloading twice is a no-op
+        config.check_for_changes()
+
+    def _on_config_changed(self, diff):
+        """
+        Update the widgets affected by a configuration change.
+
+        Args:
+            diff: ConfigDiff describing what changed
+        """
+        self.header_widget.apply_config_diff(diff)
+        self.draft_order_widget.apply_config_diff(diff)
+        self.standings_widget.apply_config_diff(diff)
+        self.draft_pick_selector_widget.apply_config_diff(diff)
+        self.lottery_window_widget.apply_config_diff(diff)
+
+        # Odds and pick holders depend on the team count, rules, traded picks and seed order
+        if diff.lottery_changed:
+            if self.pick_number == 0:
+                self._start_lottery_worker()
+            else:
+                self.statusBar().showMessage("Lottery settings changed; they apply to the next lottery")
 
     def _setup_ui(self):
         """Initialize and configure all UI components."""
@@ -117,6 +247,25 @@ class MainWindow(QMainWindow):
             # Increment pick number
             self.pick_number += 1
 
+            # Show the exact odds of the owners still waiting
+            self._show_remaining_odds()
+
+    def _show_remaining_odds(self):
+        """Show each remaining owner's odds of the next pick and their expected pick."""
+        if self.lottery_simulation is None or self.pick_number >= len(self.pick_order):
+            self.lottery_window_widget.show_remaining_odds([])
+            return
+        revealed = self.pick_order[:self.pick_number]
+        if self.lottery_simulation.rules is None:
+            # Exact odds of every remaining pick given the reveals so far
+            first_pick = self.pick_number + 1
+            odds = [(owner, row[0], first_pick + row @ range(len(row)))
+                    for owner, row in self.lottery_simulation.remainingOdds(revealed).items()]
+        else:
+            odds = [(owner, probability, None)
+                    for owner, probability in self.lottery_simulation.nextPickOdds(revealed).items()]
+        self.lottery_window_widget.show_remaining_odds(sorted(odds, key=lambda item: item[1], reverse=True))
+
     def _on_pick_confirmed(self, position, owner_name):
         """
         Handle pick confirmation.
@@ -135,7 +284,12 @@ class MainWindow(QMainWindow):
 def main():
     """Application entry point."""
     app = QApplication(sys.argv)
+    if profiler:
+        profiler.mark("qapplication")
     window = MainWindow()
+    if profiler:
+        profiler.mark("main_window")
+        profiler.watch_first_paint(app, window)
     window.show()
     app.exec()
 
@@ -0,0 +1,149 @@
+"""
+Startup instrumentation for the Fantasy Football Lottery application.
+
+Run with --profile-startup to report the cost of every import made while the
+application starts and the time until the main window is first painted. Add
+--exit-after-paint to quit right after the first paint (used by the startup
+benchmark). The report is printed as text followed by one machine-readable
+line starting with STARTUP_PROFILE. Only imports made on the thread that
+installed the profiler (the GUI thread) are timed; background workers import
+in parallel and do not delay the first paint.
+"""
+
+import builtins
+import importlib.util
+import json
+import sys
+import threading
+import time
+
+PROFILE_FLAG = "--profile-startup"
+EXIT_FLAG = "--exit-after-paint"
+REPORT_PREFIX = "STARTUP_PROFILE "
+
+
+class StartupProfiler:
+    """Records per-module import cost and startup milestones."""
+
+    def __init__(self, exit_after_paint=False):
+        self.start = time.perf_counter()
+        self.exit_after_paint = exit_after_paint
+        self.imports = {}
+        self.marks = {}
+        self._stack = []
+        self._thread = None
+        self._original_import = None
+        self._paint_filter = None
+
+    def install(self):
+        """Start timing imports made on the calling thread."""
+        self._thread = threading.get_ident()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self):
+        """Stop timing imports."""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # The hook is process-wide; other threads' imports would corrupt the stack
+        if threading.get_ident() != self._thread:
+            return self._original_import(name, globals, locals, fromlist, level)
+        loaded = len(sys.modules)
+        self._stack.append(0.0)
+        began = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - began
+            nested = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            if len(sys.modules) != loaded:
+                label = self._label(name, globals, fromlist, level)
+                inclusive, exclusive = self.imports.get(label, (0.0, 0.0))
+                self.imports[label] = (inclusive + elapsed, exclusive + elapsed - nested)
+
+    @staticmethod
+    def _label(name, globals, fromlist, level):
+        """Name an import statement after the module it actually loaded."""
+        if level:
+            package = (globals or {}).get("__package__") or ""
+            name = importlib.util.resolve_name("." * level + name, package)
+        for item in fromlist or ():
+            if f"{name}.{item}" in sys.modules:
+                return f"{name}.{item}"
+        return name
+
+    def mark(self, label):
+        """Record the time since startup under label."""
+        self.marks[label] = time.perf_counter() - self.start
+
+    def watch_first_paint(self, app, window):
+        """
+        Mark the first paint of window, then report (and optionally quit).
+
+        Args:
+            app: The running QApplication
+            window: Top-level widget whose first paint ends startup
+        """
+        from PyQt5.QtCore import QEvent, QObject, QTimer
+
+        profiler = self
+
+        class FirstPaintFilter(QObject):
+            def eventFilter(self, watched, event):
+                if event.type() == QEvent.Paint and "first_paint" not in profiler.marks:
+                    profiler.mark("first_paint")
+                    watched.removeEventFilter(self)
+                    profiler.uninstall()
+                    print(profiler.report())
+                    if profiler.exit_after_paint:
+                        QTimer.singleShot(0, app.quit)
+                return False
+
+        self._paint_filter = FirstPaintFilter()
+        window.installEventFilter(self._paint_filter)
+
+    def report(self, top=25):
+        """
+        Format the slowest imports and startup milestones.
+
+        Args:
+            top: Number of imports to list, slowest self-time first
+
+        Returns:
+            Report text ending in a STARTUP_PROFILE JSON line
+        """
+        lines = ["Startup profile", f"{'self ms':>9} {'total ms':>9}  module"]
+        ranked = sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)
+        for name, (inclusive, exclusive) in ranked[:top]:
+            lines.append(f"{exclusive * 1000:9.1f} {inclusive * 1000:9.1f}  {name}")
+        for label, seconds in self.marks.items():
+            lines.append(f"{label}: {seconds * 1000:.1f} ms")
+
+        summary = {
+            "marks_ms": {label: round(seconds * 1000, 3) for label, seconds in self.marks.items()},
+            "imports_ms": {name: round(exclusive * 1000, 3) for name, (_, exclusive) in ranked},
+        }
+        lines.append(REPORT_PREFIX + json.dumps(summary))
+        return "\n".join(lines)
+
+
+def profiler_from_argv(argv):
+    """
+    Create and install a StartupProfiler if --profile-startup was passed.
+
+    Args:
+        argv: Command-line arguments (usually sys.argv)
+
+    Returns:
+        The installed StartupProfiler, or None when profiling is off
+    """
+    if PROFILE_FLAG not in argv:
+        return None
+    profiler = StartupProfiler(exit_after_paint=EXIT_FLAG in argv)
+    profiler.install()
+    return profiler
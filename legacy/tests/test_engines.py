@@ -0,0 +1,128 @@
+"""
+Distribution checks of the sampling engines against the exact solver.
+
+Every engine must produce the [seed, pick] odds of exact.pick_probabilities
+for the balls the simulator actually assigned. Sample frequencies are compared
+cell by cell with a normal confidence bound; fixed seeds keep the runs
+reproducible.
+"""
+
+import numpy as np
+import pytest
+
+from lottery.exact import (_clock_probabilities_by_picks, pick_probabilities, pick_probabilities_by_picks,
+                           seed_pick_probabilities)
+from lottery.gumbel_sampler import GumbelSampler
+from lottery.lottery_simulator import KeyedPermutation, Simulator, fit_chances, order_counts
+from lottery.parallel import simulate_counts
+from lottery.weighted_sampler import WeightedSampler
+
+N_BATCH = 200000
+N_SCALAR = 20000
+Z = 5.0
+
+# (n_teams, n_picks, chances, simulator seed)
+CASES = {
+    'full': (8, 8, [60, 50, 40, 30, 20, 15, 10, 5], 1),
+    'partial': (10, 4, [100, 80, 60, 40, 30, 20, 15, 10, 4, 1], 2),
+    'zero_weight': (8, 8, [60, 50, 40, 0, 20, 15, 10, 5], 3),
+    'partial_zero_weight': (8, 3, [20, 15, 0, 10, 0, 8, 6, 4], 4),
+    # Fewer seeds with chances than lottery picks
+    'few_live': (8, 6, [20, 0, 15, 0, 0, 8, 0, 4], 5),
+    # More chances than combinations: every seed is trimmed to fit
+    'trimmed_balls': (12, 12, [200, 182, 164, 147, 129, 112, 94, 77, 59, 42, 24, 7], 8),
+}
+
+
+def assert_matches_exact(orders, sim):
+    """Every cell's frequency lies within Z standard errors of the exact odds."""
+    n_iters = len(orders)
+    expected = pick_probabilities(sim.effective_chances, sim.n_picks)
+    observed = order_counts(np.asarray(orders), sim.len_ch) / n_iters
+    bound = Z * np.sqrt(np.clip(expected * (1 - expected), 0, None) / n_iters) + 1.0 / n_iters
+    assert (np.abs(observed - expected) <= bound).all()
+
+
+@pytest.fixture(params=sorted(CASES))
+def sim(request):
+    n_teams, n_picks, chances, seed = CASES[request.param]
+    assert len(chances) == n_teams
+    return Simulator(n_picks, 4, chances, seed=seed)
+
+
+def test_simulator_batch_matches_exact(sim):
+    assert_matches_exact(sim.play_lottery_batch(N_BATCH, rng=11), sim)
+
+
+def test_simulator_scalar_matches_exact(sim):
+    assert_matches_exact([sim.play_lottery() for _ in range(N_SCALAR)], sim)
+
+
+def test_weighted_batch_matches_exact(sim):
+    sampler = WeightedSampler(sim.n_picks, sim.effective_chances, seed=12)
+    assert_matches_exact(sampler.play_lottery_batch(N_BATCH, rng=13), sim)
+
+
+def test_weighted_scalar_matches_exact(sim):
+    sampler = WeightedSampler(sim.n_picks, sim.effective_chances, seed=14)
+    assert_matches_exact([sampler.play_lottery() for _ in range(N_SCALAR)], sim)
+
+
+def test_gumbel_batch_matches_exact(sim):
+    sampler = GumbelSampler(sim.n_picks, sim.effective_chances, seed=17)
+    assert_matches_exact(sampler.play_lottery_batch(N_BATCH, rng=18), sim)
+
+
+def test_zero_weight_seed_keeps_standings_order():
+    sampler = WeightedSampler(3, [5, 0, 0, 2], seed=15)
+    orders = sampler.play_lottery_batch(1000, rng=16)
+    # Once seeds 0 and 3 are drawn, seed 1 always picks before seed 2
+    assert (np.argmax(orders == 1, axis=1) < np.argmax(orders == 2, axis=1)).all()
+
+
+@pytest.mark.parametrize('name', sorted(CASES))
+def test_clock_solver_matches_set_solver(name):
+    n_teams, n_picks, chances, _ = CASES[name]
+    wanted = {k: k for k in range(n_teams + 1)}
+    expected = pick_probabilities_by_picks(chances, list(wanted))
+    clock = _clock_probabilities_by_picks(np.asarray(chances, dtype=np.float64), wanted)
+    for k in wanted:
+        assert np.abs(clock[k] - expected[k]).max() < 1e-10
+
+
+@pytest.mark.parametrize('name', sorted(CASES))
+def test_seed_rows_match_full_table(name):
+    n_teams, n_picks, chances, _ = CASES[name]
+    rows = seed_pick_probabilities(chances, n_picks, range(n_teams))
+    assert np.abs(rows - pick_probabilities(chances, n_picks)).max() < 1e-10
+
+
+@pytest.mark.parametrize('workers', [2, 3])
+def test_parallel_counts_do_not_depend_on_worker_count(workers):
+    sampler = WeightedSampler(4, CASES['partial'][2], seed=19)
+    serial = simulate_counts(sampler.play_lottery_batch, 10, 25000, seed=20, workers=1, block_size=4000)
+    parallel = simulate_counts(sampler.play_lottery_batch, 10, 25000, seed=20, workers=workers, block_size=4000)
+    assert serial.sum() == 25000 * 10
+    assert (parallel == serial).all()
+
+
+@pytest.mark.parametrize('size', [1, 2, 70, 1001, 5000])
+def test_keyed_permutation_is_a_bijection(size):
+    import random
+    permuted = KeyedPermutation(size, random.Random(21))(np.arange(size))
+    assert sorted(permuted.tolist()) == list(range(size))
+
+
+def test_implicit_effective_chances_fill_every_combination():
+    chances = CASES['trimmed_balls'][2]
+    sim = Simulator(12, 4, chances, seed=22, implicit=True)
+    assert sim.effective_chances.sum() == sim.n_combs
+    assert (sim.effective_chances == fit_chances(chances, sim.n_combs)).all()
+    # Every combo rank has exactly one owner, and the owners add up to the effective chances
+    owners = sim.owners_of(np.arange(sim.n_combs))
+    assert (np.bincount(owners, minlength=12) == sim.effective_chances).all()
+
+
+def test_implicit_batch_matches_exact():
+    sim = Simulator(4, 4, CASES['partial'][2], seed=23, implicit=True)
+    assert_matches_exact(sim.play_lottery_batch(N_BATCH, rng=24), sim)
@@ -0,0 +1,72 @@
+"""
+Checks of the best-first draft order enumeration against brute force.
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from lottery.exact import pick_probabilities
+from lottery.orders import iter_orders, top_orders
+
+# (chances, n_picks)
+CASES = {
+    'full': ([6, 5, 4, 3, 2, 1], 6),
+    'partial': ([6, 5, 4, 3, 2, 1], 3),
+    'ties': ([3, 3, 2, 2, 1], 5),
+    'zero_weight': ([5, 0, 3, 0, 1], 5),
+}
+
+
+def brute_force(chances, n_picks):
+    """Probability of every complete order, by drawing every prefix."""
+    n_teams = len(chances)
+    n_draws = min(n_picks, n_teams)
+    probabilities = {}
+    for drawn in itertools.permutations(range(n_teams), n_draws):
+        probability, left = 1.0, list(range(n_teams))
+        for seed in drawn:
+            total = sum(chances[s] for s in left)
+            if total > 0:
+                probability *= chances[seed] / total
+            elif seed != min(left):
+                probability = 0.0
+            left.remove(seed)
+        if probability > 0:
+            order = drawn + tuple(left)
+            probabilities[order] = probabilities.get(order, 0.0) + probability
+    return probabilities
+
+
+@pytest.mark.parametrize('name', sorted(CASES))
+def test_orders_match_brute_force_in_decreasing_probability(name):
+    chances, n_picks = CASES[name]
+    expected = brute_force(chances, n_picks)
+    found = list(iter_orders(chances, n_picks))
+
+    assert len(found) == len(expected)
+    assert sum(probability for _, probability in found) == pytest.approx(1.0)
+    for order, probability in found:
+        assert probability == pytest.approx(expected[order])
+    probabilities = [probability for _, probability in found]
+    assert all(a >= b - 1e-15 for a, b in zip(probabilities, probabilities[1:]))
+
+
+@pytest.mark.parametrize('name', sorted(CASES))
+def test_orders_reproduce_pick_probabilities(name):
+    chances, n_picks = CASES[name]
+    n_teams = len(chances)
+    table = np.zeros((n_teams, n_teams))
+    for order, probability in iter_orders(chances, n_picks):
+        table[list(order), np.arange(n_teams)] += probability
+    assert np.abs(table - pick_probabilities(chances, n_picks)).max() < 1e-12
+
+
+def test_top_orders_stops_at_k_or_mass():
+    chances, n_picks = CASES['full']
+    assert len(top_orders(chances, n_picks, k=5)) == 5
+    covering = top_orders(chances, n_picks, mass=0.1)
+    covered = sum(probability for _, probability in covering)
+    assert covered >= 0.1
+    assert covered - covering[-1][1] < 0.1
@@ -0,0 +1,62 @@
+"""
+Checks of the traded-pick remapping from seeds to pick holders.
+"""
+
+import numpy as np
+import pytest
+
+from lottery.exact import pick_probabilities
+from lottery.ownership import PickOwnership
+from lottery.weighted_sampler import WeightedSampler
+
+PLACES = ['Ann', 'Bob', 'Cat', 'Dan', 'Eve', 'Fay']
+CHANCES = [50, 40, 30, 20, 10, 5]
+# Bob holds his own pick plus Dan's, and Fay's pick left the league
+TRADES = {'Dan': 'Bob', 'Fay': 'Outsider'}
+
+
+@pytest.fixture
+def ownership():
+    return PickOwnership.from_places(PLACES, TRADES)
+
+
+def test_holders_follow_trades(ownership):
+    assert ownership.holders == PLACES + ['Outsider']
+    assert [ownership.holders[h] for h in ownership.seed_holders] == ['Ann', 'Bob', 'Cat', 'Bob', 'Eve', 'Outsider']
+
+
+def test_unknown_trading_owner_is_rejected():
+    with pytest.raises(ValueError):
+        PickOwnership.from_places(PLACES, {'Zed': 'Ann'})
+
+
+def test_pick_probabilities_sum_the_seeds_each_holder_owns(ownership):
+    probabilities = pick_probabilities(CHANCES, 3)
+    holders = ownership.pick_probabilities(probabilities)
+    assert np.allclose(holders[1], probabilities[1] + probabilities[3])
+    assert np.allclose(holders[3], 0)
+    assert np.allclose(holders[6], probabilities[5])
+    assert np.allclose(holders.sum(axis=0), 1)
+
+
+def test_top_pick_counts_per_order(ownership):
+    orders = np.array([[3, 1, 0, 2, 4, 5], [5, 4, 3, 2, 1, 0]])
+    counts = ownership.top_pick_counts(orders, 2)
+    assert counts[0].tolist() == [0, 2, 0, 0, 0, 0, 0]
+    assert counts[1].tolist() == [0, 0, 0, 0, 1, 0, 1]
+
+
+@pytest.mark.parametrize('n_picks', [2, 6])
+def test_exact_top_pick_distribution_matches_simulation(ownership, n_picks):
+    k = 3
+    exact = ownership.exact_top_pick_distribution(CHANCES, n_picks, k)
+    assert np.allclose(exact.sum(axis=1), 1)
+    # Expected top-k picks per holder agree with the pick odds
+    expected = ownership.pick_probabilities(pick_probabilities(CHANCES, n_picks))[:, :k].sum(axis=1)
+    assert np.allclose(exact @ np.arange(k + 1), expected)
+
+    n_iters = 200000
+    sampler = WeightedSampler(n_picks, CHANCES, seed=1)
+    simulated = ownership.simulated_top_pick_distribution(sampler.play_lottery_batch, n_iters, k, rng=2)
+    bound = 5 * np.sqrt(exact * (1 - exact) / n_iters) + 1.0 / n_iters
+    assert (np.abs(simulated - exact) <= bound).all()
@@ -0,0 +1,60 @@
+"""
+Checks of the rules sampler against the rules' exact solver and the rules themselves.
+"""
+
+import numpy as np
+import pytest
+
+from lottery.lottery_simulator import order_counts
+from lottery.rules import LotteryRules
+
+N_BATCH = 200000
+Z = 5.0
+CHANCES = [100, 80, 60, 40, 30, 20, 15, 10, 4, 1]
+
+# (lottery_picks, max_drop, protected seeds)
+RULES = {
+    'lottery_only': (4, None, []),
+    'max_drop': (10, 2, []),
+    'protected': (4, None, [0, 3]),
+    'everything': (6, 1, [2]),
+}
+
+
+@pytest.fixture(params=sorted(RULES))
+def lottery(request):
+    lottery_picks, max_drop, protected = RULES[request.param]
+    rules = LotteryRules(len(CHANCES), lottery_picks=lottery_picks, max_drop=max_drop, protected=protected)
+    return rules.compile(CHANCES, seed=1)
+
+
+def test_exact_probabilities_are_a_permutation_distribution(lottery):
+    probabilities = lottery.exact_probabilities()
+    assert np.allclose(probabilities.sum(axis=0), 1)
+    assert np.allclose(probabilities.sum(axis=1), 1)
+
+
+def test_batch_matches_exact(lottery):
+    expected = lottery.exact_probabilities()
+    observed = order_counts(lottery.play_lottery_batch(N_BATCH, rng=2), len(CHANCES)) / N_BATCH
+    bound = Z * np.sqrt(np.clip(expected * (1 - expected), 0, None) / N_BATCH) + 1.0 / N_BATCH
+    assert (np.abs(observed - expected) <= bound).all()
+
+
+def test_orders_respect_max_drop_and_protection(lottery):
+    rules = lottery.rules
+    orders = lottery.play_lottery_batch(20000, rng=3)
+    picks_of_seed = np.argsort(orders, axis=1)
+    if rules.max_drop is not None:
+        assert (picks_of_seed - np.arange(rules.n_teams) <= rules.max_drop).all()
+    assert (orders[:, rules.protected] == rules.protected).all()
+    # Picks after the lottery go to the undrawn seeds in standings order
+    after_lottery = orders[:, lottery.picks[lottery.n_draws:]]
+    assert (np.diff(after_lottery, axis=1) > 0).all()
+
+
+def test_exact_probabilities_respect_max_drop():
+    rules = LotteryRules(len(CHANCES), max_drop=2)
+    probabilities = rules.compile(CHANCES).exact_probabilities()
+    seeds, picks = np.nonzero(probabilities > 1e-15)
+    assert (picks - seeds <= 2).all()
@@ -0,0 +1,68 @@
+"""
+Checks of the rest-of-season standings and their tiebreaks.
+"""
+
+import numpy as np
+import pytest
+
+from lottery.exact import pick_probabilities
+from lottery.gumbel_sampler import GumbelSampler
+from lottery.season import SeasonLottery, SeasonSimulator, log5, parse_record
+
+
+def seeds(owners, records, games, points_for=None):
+    """Lottery seeds (owner indices, worst first) of a season whose games are all decided."""
+    season = SeasonSimulator(owners, records, games, points_for)
+    result = season.play_seasons(3, rng=0)
+    assert (result == result[0]).all()
+    return result[0].tolist()
+
+
+def test_parse_record():
+    assert parse_record("9-5") == (9, 5, 0)
+    assert parse_record("9-4-1") == (9, 4, 1)
+    with pytest.raises(ValueError):
+        parse_record("nine-five")
+
+
+def test_log5():
+    assert log5(0.5, 0.5) == pytest.approx(0.5)
+    assert log5(0.6, 0.4) > 0.6
+    assert log5(1.0, 1.0) == 0.5
+
+
+def test_record_decides_and_ties_count_half():
+    assert seeds(["A", "B", "C"], ["5-5", "5-4-1", "6-4"], []) == [0, 1, 2]
+
+
+def test_remaining_games_are_added_to_records():
+    # A beats B and C beats D; the tied pairs then fall back to config order
+    assert seeds(["A", "B", "C", "D"], ["5-5"] * 4, [("A", "B", 1.0), ("C", "D", 1.0)]) == [3, 1, 2, 0]
+
+
+def test_head_to_head_breaks_record_ties():
+    # B beats A and they finish 5-5: B ranks ahead despite config order
+    assert seeds(["A", "B", "C"], ["5-4", "4-5", "9-0"], [("B", "A", 1.0)]) == [0, 1, 2]
+
+
+def test_head_to_head_only_counts_games_between_tied_teams():
+    # A's win over C does not count once C finishes with a worse record
+    assert seeds(["B", "A", "C"], ["5-5", "4-5", "0-9"], [("A", "C", 1.0)]) == [2, 1, 0]
+
+
+def test_points_for_then_config_order_break_remaining_ties():
+    assert seeds(["A", "B"], ["5-5", "5-5"], [], points_for=[100.0, 200.0]) == [0, 1]
+    assert seeds(["A", "B"], ["5-5", "5-5"], []) == [1, 0]
+
+
+def test_season_lottery_without_games_matches_exact():
+    owners = ["A", "B", "C", "D", "E"]
+    chances = [50, 30, 20, 10, 5]
+    season = SeasonSimulator(owners, ["1-9", "3-7", "5-5", "7-3", "9-1"], [])
+    lottery = SeasonLottery(season, GumbelSampler(5, chances).play_lottery_batch)
+    n_iters = 200000
+    observed = lottery.slot_probabilities(n_iters, seed=1, workers=1)
+    # The worst record is owner A, so owner i holds seed i
+    expected = pick_probabilities(chances, 5)
+    bound = 5 * np.sqrt(expected * (1 - expected) / n_iters) + 1.0 / n_iters
+    assert (np.abs(observed - expected) <= bound).all()
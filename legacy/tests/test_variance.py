@@ -0,0 +1,50 @@
+"""
+Checks of the variance-reduced clock estimator against the exact solver.
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from lottery.exact import pick_probabilities
+from lottery.variance import poisson_binomial, run_variance_reduced
+
+N_SAMPLES = 20000
+Z = 5.0
+
+# (chances, n_picks)
+CASES = {
+    'full': ([60, 50, 40, 30, 20, 15, 10, 5], 8),
+    'partial': ([100, 80, 60, 40, 30, 20, 15, 10, 4, 1], 4),
+    'zero_weight': ([60, 50, 40, 0, 20, 15, 10, 5], 8),
+    'partial_zero_weight': ([20, 15, 0, 10, 0, 8, 6, 4], 3),
+    'few_live': ([20, 0, 15, 0, 0, 8, 0, 4], 6),
+}
+
+
+def test_poisson_binomial_matches_enumeration():
+    p = np.array([0.1, 0.5, 0.7, 0.25])
+    expected = np.zeros(len(p) + 1)
+    for outcome in itertools.product([0, 1], repeat=len(p)):
+        expected[sum(outcome)] += np.prod(np.where(outcome, p, 1 - p))
+    assert np.allclose(poisson_binomial(p, len(p)), expected)
+    assert np.allclose(poisson_binomial(p, 2), expected[:3])
+
+
+@pytest.mark.parametrize('name', sorted(CASES))
+def test_estimate_matches_exact(name):
+    chances, n_picks = CASES[name]
+    result = run_variance_reduced(chances, n_picks, tol=0.0, max_iters=N_SAMPLES, rng=1)
+    expected = pick_probabilities(chances, n_picks)
+    assert result.n_iters == N_SAMPLES
+    # ci_width is 2 * 1.96 standard errors
+    standard_error = result.ci_width / (2 * 1.96)
+    assert (np.abs(result.probabilities - expected) <= Z * standard_error + 1e-9).all()
+    assert np.allclose(result.probabilities.sum(axis=0), 1)
+
+
+def test_estimate_beats_plain_sampling():
+    chances, n_picks = CASES['full']
+    result = run_variance_reduced(chances, n_picks, tol=0.0, max_iters=N_SAMPLES, rng=2)
+    assert result.speedup > 10
@@ -0,0 +1,42 @@
+"""
+Config file watcher for the Fantasy Football Lottery application.
+Reloads league_config.json when it changes on disk and re-emits the change on the GUI thread.
+"""
+
+import os
+
+from PyQt5.QtCore import QFileSystemWatcher, QObject, pyqtSignal
+
+from config.config_manager import config
+
+
+class ConfigWatcher(QObject):
+    """
+    Watches the configuration file and reports changes.
+
+    Signals:
+        config_changed: Emitted with a ConfigDiff after the configuration changed
+    """
+
+    config_changed = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self._on_file_changed)
+        self._watch()
+
+        # Reloads may happen on any thread; the signal is delivered on ours
+        self._listener = self.config_changed.emit
+        config.add_listener(self._listener)
+        self.destroyed.connect(lambda: config.remove_listener(self._listener))
+
+    def _watch(self):
+        """Watch the config file (again, if an editor replaced it)."""
+        if os.path.exists(config.config_path) and config.config_path not in self.watcher.files():
+            self.watcher.addPath(config.config_path)
+
+    def _on_file_changed(self, path):
+        """Reload the configuration when the file changed."""
+        self._watch()
+        config.check_for_changes()
@@ -243,7 +243,7 @@ class ConfigWidget(QWidget):
             # Reload the global config
             config.reload_config()
 
-            QMessageBox.information(self, "Success", "Configuration saved successfully!\n\nPlease restart the application for changes to take effect.")
+            QMessageBox.information(self, "Success", "Configuration saved successfully!")
             self.config_saved.emit()
             self.close()
 
@@ -67,13 +67,36 @@ class DraftOrderWidget(QWidget):
         layout.setSpacing(8)  # Small spacing between picks
         layout.setContentsMargins(8, 0, 8, 0)  # Remove margins
 
+        self.setLayout(layout)
+
         # Create pick box for each draft pick
-        for i in range(config.number_of_teams):
-            pick_box = DraftPickBox(i + 1)  # Pick numbers are 1-indexed for display
+        self.set_number_of_picks(config.number_of_teams)
+
+    def set_number_of_picks(self, number_of_picks):
+        """
+        Add or remove pick boxes at the end, keeping the existing picks.
+
+        Args:
+            number_of_picks: Number of draft picks to show
+        """
+        while len(self.picks) < number_of_picks:
+            pick_box = DraftPickBox(len(self.picks) + 1)  # Pick numbers are 1-indexed for display
             self.picks.append(pick_box)
-            layout.addWidget(pick_box)
+            self.layout().addWidget(pick_box)
+        while len(self.picks) > number_of_picks:
+            pick_box = self.picks.pop()
+            self.layout().removeWidget(pick_box)
+            pick_box.deleteLater()
 
-        self.setLayout(layout)
+    def apply_config_diff(self, diff):
+        """
+        Update the draft order after a configuration change.
+
+        Args:
+            diff: ConfigDiff describing what changed
+        """
+        if "number_of_teams" in diff.changed_settings:
+            self.set_number_of_picks(config.number_of_teams)
 
     def set_pick(self, position, owner_name):
         """
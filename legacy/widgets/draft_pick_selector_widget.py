@@ -39,21 +39,8 @@ class DraftPickSelectorWidget(QWidget):
         main_layout = QHBoxLayout()
 
         # Create two columns
-        left_layout = QVBoxLayout()
-        right_layout = QVBoxLayout()
-
-        # Create pick buttons (1-12)
-        for i in range(config.number_of_teams):
-            button = QPushButton(str(i + 1))
-            button.setStyleSheet(DRAFT_PICK_SELECTOR)
-            button.clicked.connect(lambda checked, pos=i: self._on_pick_selected(pos))
-            self.pick_buttons.append(button)
-
-            # Distribute buttons across two columns
-            if i < config.number_of_teams / 2:
-                left_layout.addWidget(button)
-            else:
-                right_layout.addWidget(button)
+        self.left_layout = QVBoxLayout()
+        self.right_layout = QVBoxLayout()
 
         # Create Undo and Confirm buttons
         self.cancel_button = QPushButton("Undo")
@@ -69,15 +56,62 @@ class DraftPickSelectorWidget(QWidget):
         self.confirm_button.setEnabled(False)
 
         # Add control buttons to columns
-        left_layout.addWidget(self.cancel_button)
-        right_layout.addWidget(self.confirm_button)
+        self.left_layout.addWidget(self.cancel_button)
+        self.right_layout.addWidget(self.confirm_button)
 
         # Add columns to main layout
-        main_layout.addLayout(left_layout)
-        main_layout.addLayout(right_layout)
+        main_layout.addLayout(self.left_layout)
+        main_layout.addLayout(self.right_layout)
 
         self.setLayout(main_layout)
 
+        # Create pick buttons (1-12)
+        self.set_number_of_picks(config.number_of_teams)
+
+    def set_number_of_picks(self, number_of_picks):
+        """
+        Recreate the pick buttons for a new number of picks.
+
+        Picks that were already confirmed stay disabled.
+
+        Args:
+            number_of_picks: Number of draft picks to offer
+        """
+        taken = [not button.isEnabled() for button in self.pick_buttons]
+        for button in self.pick_buttons:
+            button.setParent(None)
+            button.deleteLater()
+        self.pick_buttons = []
+        self.selected_button = None
+        self.selected_position = None
+
+        for i in range(number_of_picks):
+            button = QPushButton(str(i + 1))
+            button.setStyleSheet(DRAFT_PICK_SELECTOR)
+            button.clicked.connect(lambda checked, pos=i: self._on_pick_selected(pos))
+            if i < len(taken) and taken[i]:
+                button.setEnabled(False)
+                button.setStyleSheet(DRAFT_PICK_SELECTOR_DISABLED)
+            self.pick_buttons.append(button)
+
+        # Distribute buttons across two columns, above the Undo/Confirm buttons
+        left_count = (number_of_picks + 1) // 2
+        for i, button in enumerate(self.pick_buttons):
+            if i < left_count:
+                self.left_layout.insertWidget(i, button)
+            else:
+                self.right_layout.insertWidget(i - left_count, button)
+
+    def apply_config_diff(self, diff):
+        """
+        Update the pick buttons after a configuration change.
+
+        Args:
+            diff: ConfigDiff describing what changed
+        """
+        if "number_of_teams" in diff.changed_settings:
+            self.set_number_of_picks(config.number_of_teams)
+
     def _on_pick_selected(self, position):
         """
         Handle pick button selection.
@@ -5,10 +5,10 @@ Displays the league logo and name.
 
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QHBoxLayout, QLabel, QWidget
-from PyQt5.QtGui import QPixmap
 
 from config.styles import HEADER
 from config.config_manager import config
+from widgets.image_cache import image_cache
 
 
 class HeaderWidget(QWidget):
@@ -24,17 +24,27 @@ class HeaderWidget(QWidget):
         layout.setAlignment(Qt.AlignCenter)
 
         # Logo image
-        image_label = QLabel()
-        pixmap = QPixmap(config.logo_path)
-        pixmap = pixmap.scaledToHeight(150)
-        image_label.setPixmap(pixmap)
+        self.image_label = QLabel()
+        self.image_label.setPixmap(image_cache.pixmap(config.logo_path, 150))
 
         # League name text
-        text_label = QLabel(config.league_name)
-        text_label.setStyleSheet(HEADER)
+        self.text_label = QLabel(config.league_name)
+        self.text_label.setStyleSheet(HEADER)
 
         # Add widgets to layout
-        layout.addWidget(image_label, alignment=Qt.AlignCenter)
-        layout.addWidget(text_label, alignment=Qt.AlignCenter)
+        layout.addWidget(self.image_label, alignment=Qt.AlignCenter)
+        layout.addWidget(self.text_label, alignment=Qt.AlignCenter)
 
         self.setLayout(layout)
+
+    def apply_config_diff(self, diff):
+        """
+        Update the header after a configuration change.
+
+        Args:
+            diff: ConfigDiff describing what changed
+        """
+        if "league_name" in diff.changed_settings:
+            self.text_label.setText(config.league_name)
+        if "logo_path" in diff.changed_settings:
+            self.image_label.setPixmap(image_cache.pixmap(config.logo_path, 150))
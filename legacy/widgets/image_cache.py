@@ -0,0 +1,91 @@
+"""
+Shared cache of decoded and scaled images for the Fantasy Football Lottery application.
+
+Owner photos and the league logo are decoded from disk and scaled once, then
+reused by every widget. Images can be pre-warmed on a background thread:
+QImage decoding and scaling are thread-safe, while the QPixmap conversion is
+done lazily on the GUI thread when an image is first requested.
+"""
+
+import threading
+
+from PyQt5.QtCore import QRunnable, QThreadPool
+from PyQt5.QtGui import QImage, QPixmap
+
+
+class _PrewarmTask(QRunnable):
+    """Decodes and scales a list of images off the GUI thread."""
+
+    def __init__(self, cache, paths, height):
+        super().__init__()
+        self.cache = cache
+        self.paths = paths
+        self.height = height
+
+    def run(self):
+        for path in self.paths:
+            self.cache._load_image(path, self.height)
+
+
+class ImageCache:
+    """Cache of scaled pixmaps keyed by (path, height)."""
+
+    def __init__(self):
+        self._pixmaps = {}
+        self._images = {}
+        self._lock = threading.Lock()
+
+    def _load_image(self, path, height):
+        """Decode and scale an image unless it is already cached."""
+        key = (path, height)
+        with self._lock:
+            if key in self._images or key in self._pixmaps:
+                return
+        image = QImage(path)
+        if not image.isNull():
+            image = image.scaledToHeight(height)
+        with self._lock:
+            if key not in self._pixmaps:
+                self._images.setdefault(key, image)
+
+    def prewarm(self, paths, height):
+        """
+        Decode and scale images in the background.
+
+        Args:
+            paths: Resolved image paths
+            height: Target height in pixels
+        """
+        QThreadPool.globalInstance().start(_PrewarmTask(self, list(dict.fromkeys(paths)), height))
+
+    def pixmap(self, path, height):
+        """
+        Get the pixmap for an image scaled to height.
+
+        Args:
+            path: Resolved image path
+            height: Target height in pixels
+
+        Returns:
+            Cached QPixmap (null if the image could not be read)
+        """
+        key = (path, height)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            self._load_image(path, height)
+            with self._lock:
+                image = self._images.pop(key)
+            pixmap = QPixmap.fromImage(image)
+            with self._lock:
+                self._pixmaps[key] = pixmap
+        return pixmap
+
+    def clear(self):
+        """Drop every cached image."""
+        with self._lock:
+            self._images.clear()
+            self._pixmaps.clear()
+
+
+# Global image cache instance
+image_cache = ImageCache()
@@ -5,10 +5,12 @@ Displays the current owner selection and next pick button.
 
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtWidgets import QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
-from PyQt5.QtGui import QPixmap
 
 from config.styles import LOTTERY_WINDOW_BACKGROUND, NEXT_PICK_BUTTON
 from config.config_manager import config
+from widgets.image_cache import image_cache
+
+OWNER_IMAGE_HEIGHT = 250
 
 
 class LotteryWindowWidget(QWidget):
@@ -24,8 +26,12 @@ class LotteryWindowWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.is_started = False
+        self.owner_images = config.owner_images
         self._setup_ui()
 
+        # Decode owner photos while the intro card is showing
+        image_cache.prewarm(self.owner_images.values(), OWNER_IMAGE_HEIGHT)
+
     def _setup_ui(self):
         """Initialize and configure the lottery window UI elements."""
         main_layout = QHBoxLayout()
@@ -60,9 +66,7 @@ class LotteryWindowWidget(QWidget):
 
         # Owner image
         self.owner_image_label = QLabel("", alignment=Qt.AlignCenter)
-        pixmap = QPixmap(config.logo_path)
-        pixmap = pixmap.scaledToHeight(250)
-        self.owner_image_label.setPixmap(pixmap)
+        self.owner_image_label.setPixmap(image_cache.pixmap(config.logo_path, OWNER_IMAGE_HEIGHT))
 
         # Owner name
         self.owner_name_label = QLabel(
@@ -70,8 +74,12 @@ class LotteryWindowWidget(QWidget):
             alignment=Qt.AlignCenter
         )
 
+        # Odds of the owners still waiting to be revealed
+        self.remaining_odds_label = QLabel("", alignment=Qt.AlignCenter)
+
         owner_card_layout.addWidget(self.owner_image_label, alignment=Qt.AlignCenter)
         owner_card_layout.addWidget(self.owner_name_label, alignment=Qt.AlignCenter)
+        owner_card_layout.addWidget(self.remaining_odds_label, alignment=Qt.AlignCenter)
 
         parent_layout.addLayout(owner_card_layout)
 
@@ -94,16 +102,51 @@ class LotteryWindowWidget(QWidget):
         self.owner_name_label.setText(owner_name)
 
         # Update image if available
-        owner_images = config.owner_images
-        if owner_name in owner_images:
-            pixmap = QPixmap(owner_images[owner_name])
-            pixmap = pixmap.scaledToHeight(250)
-            self.owner_image_label.setPixmap(pixmap)
+        if owner_name in self.owner_images:
+            self.owner_image_label.setPixmap(image_cache.pixmap(self.owner_images[owner_name], OWNER_IMAGE_HEIGHT))
+
+    def apply_config_diff(self, diff):
+        """
+        Update owner images and the intro logo after a configuration change.
+
+        Args:
+            diff: ConfigDiff describing what changed
+        """
+        if diff.added_owners or diff.changed_owners or diff.removed_owners:
+            self.owner_images = config.owner_images
+            changed = diff.added_owners + diff.changed_owners
+            image_cache.prewarm([self.owner_images[name] for name in changed], OWNER_IMAGE_HEIGHT)
+        if "logo_path" in diff.changed_settings and not self.is_started:
+            self.owner_image_label.setPixmap(image_cache.pixmap(config.logo_path, OWNER_IMAGE_HEIGHT))
+
+    def show_remaining_odds(self, odds):
+        """
+        Show the remaining owners' odds of being revealed next.
+
+        Args:
+            odds: List of (owner_name, next_pick_probability, expected_pick)
+                tuples, expected_pick being None when unknown; empty hides
+                the odds
+        """
+        if not odds:
+            self.remaining_odds_label.setText("")
+            return
+        lines = []
+        for owner, probability, expected_pick in odds:
+            line = f"{owner}: {probability:.1%}"
+            if expected_pick is not None:
+                line += f"  (expected pick {expected_pick:.1f})"
+            lines.append(line)
+        self.remaining_odds_label.setText("Odds for the next pick\n" + "\n".join(lines))
 
     def enable_next_pick_button(self):
         """Enable the next pick button."""
         self.next_pick_button.setEnabled(True)
 
+    def disable_next_pick_button(self):
+        """Disable the next pick button."""
+        self.next_pick_button.setEnabled(False)
+
     def get_owner_name(self):
         """
         Get the currently displayed owner name.
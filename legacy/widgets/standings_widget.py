@@ -35,9 +35,22 @@ class StandingsWidget(QWidget):
         container = QWidget()
         container.setStyleSheet(STANDINGS_CONTAINER)
 
-        layout = QVBoxLayout()
-        layout.setSpacing(0)  # Remove spacing between rows
-        layout.setContentsMargins(0, 0, 0, 0)  # Remove margins
+        self.rows_layout = QVBoxLayout()
+        self.rows_layout.setSpacing(0)  # Remove spacing between rows
+        self.rows_layout.setContentsMargins(0, 0, 0, 0)  # Remove margins
+        self.owner_rows = {}
+        self._populate_rows()
+
+        container.setLayout(self.rows_layout)
+
+        # Wrapper layout
+        wrapper_layout = QVBoxLayout()
+        wrapper_layout.addWidget(container)
+        self.setLayout(wrapper_layout)
+
+    def _populate_rows(self):
+        """Create the header row and one row per team."""
+        layout = self.rows_layout
 
         if not len(self.standings_data):
             # Show error message if no data
@@ -64,14 +77,40 @@ class StandingsWidget(QWidget):
                     is_first=(i == 0),
                     is_last=(i == min(config.number_of_teams - 1, len(self.standings_data) - 1))
                 )
+                self.owner_rows[self.standings_data[i][0]] = row_widget
                 layout.addWidget(row_widget)
 
-        container.setLayout(layout)
+    def _clear_rows(self):
+        """Remove every row from the standings table."""
+        while self.rows_layout.count():
+            item = self.rows_layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+        self.owner_rows = {}
 
-        # Wrapper layout
-        wrapper_layout = QVBoxLayout()
-        wrapper_layout.addWidget(container)
-        self.setLayout(wrapper_layout)
+    def apply_config_diff(self, diff):
+        """
+        Update the standings after a configuration change.
+
+        Only the rows of owners whose data changed are updated, unless owners
+        were added, removed or reordered, which rebuilds the table.
+
+        Args:
+            diff: ConfigDiff describing what changed
+        """
+        self._load_standings()
+        if diff.order_changed or "number_of_teams" in diff.changed_settings:
+            self._clear_rows()
+            self._populate_rows()
+            return
+
+        standings = {row[0]: row for row in self.standings_data}
+        for owner in diff.changed_owners:
+            row_widget = self.owner_rows.get(owner)
+            if row_widget is not None:
+                _, team, record = standings[owner]
+                row_widget.team_label.setText(str(team))
+                row_widget.record_label.setText(str(record))
 
     def _create_standings_row(self, owner, team, record, is_first=False, is_last=False):
         """
@@ -117,4 +156,8 @@ class StandingsWidget(QWidget):
         row_layout.addWidget(team_label)
         row_layout.addWidget(record_label)
 
+        # Keep the labels for in-place updates
+        row_widget.team_label = team_label
+        row_widget.record_label = record_label
+
         return row_widget